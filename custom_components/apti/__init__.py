@@ -2,41 +2,161 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import APTiApiError, APTiAuthError, APTiClient
-from .const import DEFAULT_SCAN_INTERVAL_MINUTES, DOMAIN, PLATFORMS
-from .coordinator import APTiDataUpdateCoordinator
+from .api import (
+    CACHE_GROUP_ACCOUNT,
+    CACHE_GROUP_AUTO_DISCOUNT,
+    CACHE_GROUP_PARKING_APPLICATION,
+    APTiApiError,
+    APTiAuthError,
+    APTiClient,
+)
+from .backfill import APTiBillBackfill
+from .const import (
+    CONF_BACKFILL_MONTHS,
+    CONF_CACHE_TTL_ACCOUNT,
+    CONF_CACHE_TTL_AUTO_DISCOUNT,
+    CONF_CACHE_TTL_PARKING_APPLICATION,
+    CONF_DEDICATED_SESSION,
+    CONF_DISABLED_CATEGORIES,
+    CONF_SCAN_INTERVALS,
+    DEFAULT_BACKFILL_MONTHS,
+    DEFAULT_CACHE_TTL_MINUTES,
+    DEFAULT_DEDICATED_SESSION,
+    DEFAULT_SCAN_INTERVALS_MINUTES,
+    DEVICE_ENERGY,
+    DEVICE_MANAGEMENT_FEE,
+    DOMAIN,
+    PLATFORMS,
+)
+from .coordinator import COORDINATORS, APTiDataUpdateCoordinator
+from .session import async_acquire_session, async_release_session
+from .statistics import APTiStatisticsImporter
+from .storage import APTiBillArchive, APTiStore
+
+
+def _option_minutes(entry: ConfigEntry, option: str) -> int:
+    """Return a minutes option with its default."""
+    return int(entry.options.get(option, DEFAULT_CACHE_TTL_MINUTES[option]))
+
+
+def _scan_interval(entry: ConfigEntry, category: str) -> timedelta:
+    """Return the polling interval option of a device group."""
+    return timedelta(
+        minutes=int(
+            entry.options.get(
+                CONF_SCAN_INTERVALS[category], DEFAULT_SCAN_INTERVALS_MINUTES[category]
+            )
+        )
+    )
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry to the current version."""
+    if entry.version > 2:
+        return False
+
+    if entry.version == 1:
+        # Version 1 polled everything at one interval; keep it for every device group.
+        data = dict(entry.data)
+        options = dict(entry.options)
+        legacy = options.pop(CONF_SCAN_INTERVAL, data.pop(CONF_SCAN_INTERVAL, None))
+        if legacy is not None:
+            for option in CONF_SCAN_INTERVALS.values():
+                options.setdefault(option, int(legacy))
+        hass.config_entries.async_update_entry(entry, data=data, options=options, version=2)
+
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up APTi from a config entry."""
-    session = async_get_clientsession(hass)
+    if entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION):
+        session = async_acquire_session(hass, entry.entry_id).session
+    else:
+        session = async_get_clientsession(hass)
     client = APTiClient(
         session,
         entry.data[CONF_USERNAME],
         entry.data[CONF_PASSWORD],
     )
+    cache_ttls = {
+        group: _option_minutes(entry, option) * 60
+        for group, option in (
+            (CACHE_GROUP_ACCOUNT, CONF_CACHE_TTL_ACCOUNT),
+            (CACHE_GROUP_PARKING_APPLICATION, CONF_CACHE_TTL_PARKING_APPLICATION),
+            (CACHE_GROUP_AUTO_DISCOUNT, CONF_CACHE_TTL_AUTO_DISCOUNT),
+        )
+    }
+    client.set_cache_ttls(cache_ttls)
+    try:
+        return await _async_setup_client(hass, entry, client)
+    except Exception:
+        await async_release_session(hass, entry.entry_id)
+        raise
 
-    interval_minutes = entry.options.get(
-        CONF_SCAN_INTERVAL,
-        entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL_MINUTES),
-    )
-    coordinator = APTiDataUpdateCoordinator(
-        hass,
-        entry,
-        client,
-        update_interval=timedelta(minutes=int(interval_minutes)),
-    )
 
+async def _async_setup_client(
+    hass: HomeAssistant, entry: ConfigEntry, client: APTiClient
+) -> bool:
+    """Set up coordinators and platforms around a configured client."""
+    store = APTiStore(hass, entry.entry_id)
+    await store.async_load()
+    if store.token:
+        client.restore_token(store.token)
+    client.restore_endpoint_breakers(store.endpoint_breakers)
+    bill_archive = APTiBillArchive(hass, client)
+    await bill_archive.async_load()
+
+    disabled_categories = set(entry.options.get(CONF_DISABLED_CATEGORIES, []))
+    coordinators: dict[str, APTiDataUpdateCoordinator] = {
+        category: coordinator_cls(
+            hass,
+            entry,
+            client,
+            store,
+            bill_archive,
+            update_interval=_scan_interval(entry, category),
+        )
+        for category, coordinator_cls in COORDINATORS.items()
+        if category not in disabled_categories
+    }
+
+    restored: list[APTiDataUpdateCoordinator] = []
+    pending: list[APTiDataUpdateCoordinator] = []
+    for category, coordinator in coordinators.items():
+        snapshot = store.snapshot(category)
+        if snapshot is None:
+            pending.append(coordinator)
+            continue
+        # Create entities from the cached snapshot and refresh from the network afterwards.
+        if category == DEVICE_MANAGEMENT_FEE:
+            bill_archive.set_current_bill_ym(snapshot.get("manage_home", {}).get("billYm"))
+        coordinator.async_set_updated_data(snapshot)
+        restored.append(coordinator)
+
+    fee_coordinator = coordinators[DEVICE_MANAGEMENT_FEE]
+    energy_coordinator = coordinators.get(DEVICE_ENERGY)
     try:
-        await coordinator.async_config_entry_first_refresh()
+        # The fee coordinator learns the billing month energy data is archived under.
+        if fee_coordinator in pending:
+            await fee_coordinator.async_config_entry_first_refresh()
+        await asyncio.gather(
+            *(
+                coordinator.async_config_entry_first_refresh()
+                for coordinator in pending
+                if coordinator is not fee_coordinator
+            )
+        )
     except ConfigEntryAuthFailed:
         raise
     except APTiAuthError as err:
@@ -46,13 +166,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as err:
         raise ConfigEntryNotReady(f"Failed to initialize APTi integration: {err}") from err
 
+    backfill = APTiBillBackfill(
+        hass,
+        bill_archive,
+        int(entry.options.get(CONF_BACKFILL_MONTHS, DEFAULT_BACKFILL_MONTHS)),
+    )
+
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "client": client,
-        "coordinator": coordinator,
+        "coordinators": coordinators,
+        "bill_archive": bill_archive,
+        "backfill": backfill,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    for coordinator in restored:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN}_{coordinator.category}_initial_refresh",
+        )
+    importer = APTiStatisticsImporter(hass, entry, bill_archive)
+
+    @callback
+    def _async_import_statistics() -> None:
+        if not backfill.running:
+            energy_data = energy_coordinator.data if energy_coordinator else None
+            importer.async_import({**(fee_coordinator.data or {}), **(energy_data or {})})
+
+    for coordinator in (fee_coordinator, energy_coordinator):
+        if coordinator is not None:
+            entry.async_on_unload(coordinator.async_add_listener(_async_import_statistics))
+
+    @callback
+    def _async_entity_registry_updated(
+        event: Event[er.EventEntityRegistryUpdatedData],
+    ) -> None:
+        if event.data["action"] != "update" or "disabled_by" not in event.data["changes"]:
+            return
+        registry_entry = er.async_get(hass).async_get(event.data["entity_id"])
+        if registry_entry is None or registry_entry.config_entry_id != entry.entry_id:
+            return
+        for coordinator in coordinators.values():
+            coordinator.async_reader_toggled(
+                registry_entry.unique_id, not registry_entry.disabled
+            )
+
+    entry.async_on_unload(
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_entity_registry_updated)
+    )
+    entry.async_on_unload(backfill.async_add_listener(_async_import_statistics))
+    backfill.async_start(entry)
     return True
 
 
@@ -60,10 +225,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload APTi config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        runtime = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if runtime:
+            await runtime["client"].async_close()
+        await async_release_session(hass, entry.entry_id)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete persisted state when the config entry is removed."""
+    await APTiStore(hass, entry.entry_id).async_remove()
+    await APTiBillArchive.async_remove_account(hass, entry.data[CONF_USERNAME])
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options are updated."""
     await hass.config_entries.async_reload(entry.entry_id)
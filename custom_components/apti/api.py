@@ -2,14 +2,84 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from importlib.util import find_spec
+import logging
+import random
+import re
+import time
 from typing import Any
 
-from aiohttp import ClientError, ClientResponseError, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientResponseError, ClientSession, hdrs
 from yarl import URL
 
+from .breaker import CircuitBreakers
+from .cache import ResponseCache
 from .const import API_BASE_URL
+from .limiter import AIMDLimiter
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# aiohttp decodes brotli only when one of these packages is installed.
+ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if find_spec("brotli") or find_spec("brotlicffi")
+    else "gzip, deflate"
+)
+
+_LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT_SECONDS = 20
+# Idempotent GETs are retried this many times, backing off from the base delay.
+MAX_RETRIES = 2
+RETRY_BASE_DELAY_SECONDS = 1.0
+MAX_RETRY_AFTER_SECONDS = 60.0
+# Stale entries are served (and refreshed in the background) up to this multiple of their TTL.
+STALE_WHILE_REVALIDATE_FACTOR = 2
+# The token is validated this long before, and again this long after, its predicted expiry.
+TOKEN_EXPIRY_MARGIN_SECONDS = 120
+
+_BASE_URL = URL(API_BASE_URL)
+# Copied per request; only the token varies between requests.
+_HEADER_TEMPLATE: dict[str, str] = {
+    "Accept": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Content-Type": "application/json",
+    "User-Agent": "HomeAssistant-APTi/0.1",
+}
+
+# Billing month path segments, folded so transfer counters stay per endpoint.
+_BILL_YM_SEGMENT = re.compile(r"/\d{6}(?=/|$)")
+# Only the parking coordinator requests endpoints under this path.
+PARKING_PATH_PREFIX = "/api/parking/"
+
+# Endpoints some complexes do not support, guarded by circuit breakers. Keys
+# match the coordinators' endpoint keys so they can report call timeouts.
+OPTIONAL_ENDPOINTS = frozenset(
+    {
+        "account_v3",
+        "account_v3_detail",
+        "manage_payment_next",
+        "manage_auto_discount",
+        "manage_energy",
+        "parking_visit",
+        "parking_favorites",
+        "parking_application_status",
+    }
+)
+
+CACHE_GROUP_ACCOUNT = "account"
+CACHE_GROUP_PARKING_APPLICATION = "parking_application"
+CACHE_GROUP_AUTO_DISCOUNT = "auto_discount"
 
 
 class APTiApiError(Exception):
@@ -20,6 +90,127 @@ class APTiAuthError(APTiApiError):
     """Raised when APTi authentication fails."""
 
 
+class APTiRetryableError(APTiApiError):
+    """Raised for throttling, server errors and transport failures."""
+
+    def __init__(self, message: str, *, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _TokenRejectedError(Exception):
+    """The sent token was rejected and the request may be retried after a login."""
+
+
+@lru_cache(maxsize=128)
+def _endpoint_url(path: str) -> URL:
+    """Return the absolute URL of an API path, built once per path."""
+    return _BASE_URL.with_path(path)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return a ``Retry-After`` header in seconds, capped at ``MAX_RETRY_AFTER_SECONDS``."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        seconds = (retry_at - datetime.now(UTC)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+@dataclass(slots=True)
+class ConditionalCacheEntry:
+    """Validators and parsed payload of the last full response for an endpoint."""
+
+    etag: str | None
+    last_modified: str | None
+    payload: dict[str, Any] | list[Any]
+    size: int
+
+
+@dataclass(slots=True)
+class TransferCounter:
+    """Requests sent to one endpoint and bytes received, on the wire and decompressed."""
+
+    requests: int = 0
+    responses: int = 0
+    compressed_responses: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+
+    def record(self, response: ClientResponse, body: bytes) -> None:
+        """Count a response body read by aiohttp, which already decompressed it."""
+        self.responses += 1
+        self.decoded_bytes += len(body)
+        if response.headers.get(hdrs.CONTENT_ENCODING, "identity") == "identity":
+            self.wire_bytes += len(body)
+            return
+        self.compressed_responses += 1
+        # A chunked compressed body has no length header; count it uncompressed.
+        self.wire_bytes += response.content_length or len(body)
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "responses": self.responses,
+            "compressed_responses": self.compressed_responses,
+            "wire_bytes": self.wire_bytes,
+            "decoded_bytes": self.decoded_bytes,
+            "compression_ratio": (
+                round(self.wire_bytes / self.decoded_bytes, 3) if self.decoded_bytes else None
+            ),
+        }
+
+
+class TokenLifetimeTracker:
+    """Learn how long an mbl-token stays valid from observed expiries."""
+
+    def __init__(self, max_samples: int = 5) -> None:
+        self._issued_at: float | None = None
+        self._lifetimes: deque[float] = deque(maxlen=max_samples)
+
+    @property
+    def lifetime(self) -> float | None:
+        """Return the shortest observed lifetime in seconds, if any was seen."""
+        return min(self._lifetimes) if self._lifetimes else None
+
+    def issued(self, now: float) -> None:
+        """Record that a new token was issued."""
+        self._issued_at = now
+
+    def expired(self, now: float) -> None:
+        """Record that the current token was rejected."""
+        if self._issued_at is None:
+            return
+        self._lifetimes.append(now - self._issued_at)
+        self._issued_at = None
+
+    def outlived(self, now: float) -> None:
+        """Record that the current token is still valid, dropping shorter lifetimes."""
+        if self._issued_at is None:
+            return
+        age = now - self._issued_at
+        kept = [lifetime for lifetime in self._lifetimes if lifetime >= age]
+        if len(kept) != len(self._lifetimes):
+            self._lifetimes.clear()
+            self._lifetimes.extend(kept)
+
+    def remaining(self, now: float) -> float | None:
+        """Return predicted seconds until the current token expires."""
+        lifetime = self.lifetime
+        if lifetime is None or self._issued_at is None:
+            return None
+        return lifetime - (now - self._issued_at)
+
+
 class APTiClient:
     """Thin async client for the APTi mobile APIs."""
 
@@ -28,6 +219,23 @@ class APTiClient:
         self._account_id = account_id
         self._password = password
         self._mbl_token: str | None = None
+        self._login_task: asyncio.Task[dict[str, Any]] | None = None
+        self._logins_started = 0
+        self._logins_coalesced = 0
+        self._token_lifetime = TokenLifetimeTracker()
+        self._token_check: asyncio.TimerHandle | None = None
+        self._token_check_task: asyncio.Task[None] | None = None
+        self._conditional_cache: dict[str, ConditionalCacheEntry] = {}
+        self._conditional_requests = 0
+        self._conditional_hits = 0
+        self._conditional_bytes_saved = 0
+        self._response_cache = ResponseCache()
+        self._cache_ttls: dict[str, float] = {}
+        self._revalidating: dict[str, asyncio.Task[None]] = {}
+        self._limiter = AIMDLimiter()
+        self._breakers = CircuitBreakers()
+        self._retries = 0
+        self._transfers: dict[str, TransferCounter] = {}
 
     @property
     def account_id(self) -> str:
@@ -39,11 +247,145 @@ class APTiClient:
         """Return current mobile token."""
         return self._mbl_token
 
+    @property
+    def login_stats(self) -> dict[str, int]:
+        """Return counters for logins started versus coalesced into one in flight."""
+        return {
+            "started": self._logins_started,
+            "coalesced": self._logins_coalesced,
+        }
+
+    @property
+    def conditional_stats(self) -> dict[str, int | float]:
+        """Return how often validated GETs were answered with 304 Not Modified."""
+        requests = self._conditional_requests
+        return {
+            "requests": requests,
+            "hits": self._conditional_hits,
+            "hit_ratio": round(self._conditional_hits / requests, 3) if requests else 0.0,
+            "bytes_saved": self._conditional_bytes_saved,
+            "parses_saved": self._conditional_hits,
+        }
+
+    @property
+    def limiter_stats(self) -> dict[str, Any]:
+        """Return the concurrency window and retry counters."""
+        return {**self._limiter.state, "retries": self._retries}
+
+    @property
+    def transfer_stats(self) -> dict[str, dict[str, int | float]]:
+        """Return bytes received per endpoint, largest decoded total first."""
+        return {
+            endpoint: counter.as_dict()
+            for endpoint, counter in sorted(
+                self._transfers.items(),
+                key=lambda item: item[1].decoded_bytes,
+                reverse=True,
+            )
+        }
+
+    def requests_sent(self, path_prefix: str) -> int:
+        """Return requests sent so far to endpoints under ``path_prefix``, retries included."""
+        return sum(
+            counter.requests
+            for endpoint, counter in self._transfers.items()
+            if endpoint.partition(" ")[2].startswith(path_prefix)
+        )
+
+    @property
+    def breaker_stats(self) -> dict[str, Any]:
+        """Return circuit breaker state of optional endpoints."""
+        return self._breakers.state(time.time())
+
+    @property
+    def endpoint_breakers(self) -> dict[str, dict[str, float]]:
+        """Return circuit breakers to persist."""
+        return self._breakers.as_dict()
+
+    def record_timeout(self, endpoint: str) -> None:
+        """Count an optional endpoint call its caller's time budget cut off."""
+        if endpoint in OPTIONAL_ENDPOINTS:
+            self._breakers.record_failure(endpoint, time.time(), transient=True)
+
+    def restore_endpoint_breakers(self, saved: dict[str, Any] | None) -> None:
+        """Restore persisted circuit breakers."""
+        self._breakers.restore(saved)
+
+    @property
+    def response_cache_stats(self) -> dict[str, int]:
+        """Return TTL response cache counters."""
+        return self._response_cache.stats
+
+    def set_cache_ttls(self, ttls: Mapping[str, float]) -> None:
+        """Set response cache TTLs in seconds per cache group; 0 disables caching."""
+        self._cache_ttls = {group: float(ttl) for group, ttl in ttls.items()}
+
+    async def async_close(self) -> None:
+        """Cancel background revalidation and token maintenance."""
+        if self._token_check is not None:
+            self._token_check.cancel()
+            self._token_check = None
+        tasks = list(self._revalidating.values())
+        if self._token_check_task is not None:
+            tasks.append(self._token_check_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._revalidating.clear()
+
+    @property
+    def token_lifetime(self) -> float | None:
+        """Return learned token lifetime in seconds."""
+        return self._token_lifetime.lifetime
+
+    @property
+    def token_remaining(self) -> float | None:
+        """Return predicted seconds until the current token expires."""
+        return self._token_lifetime.remaining(time.monotonic())
+
+    def restore_token(self, token: str) -> None:
+        """Reuse a token persisted by a previous run."""
+        self._mbl_token = token
+
     async def async_login(self, *, force: bool = False) -> dict[str, Any]:
         """Authenticate using phone login and cache mbl-token."""
         if self._mbl_token and not force:
             return {"mblToken": self._mbl_token}
+        return await self._async_single_flight_login()
+
+    async def _async_single_flight_login(self) -> dict[str, Any]:
+        """Join the login in flight, or start one if none is running."""
+        if self._login_task is None:
+            self._logins_started += 1
+            self._login_task = asyncio.create_task(self._async_do_login())
+        else:
+            self._logins_coalesced += 1
+        # Shield so a cancelled caller does not abort the login other requests wait on.
+        return await asyncio.shield(self._login_task)
+
+    async def _async_renew_token(self, rejected_token: str | None) -> None:
+        """Replace a rejected token once, however many requests saw it fail."""
+        if (
+            self._login_task is None
+            and self._mbl_token
+            and self._mbl_token != rejected_token
+        ):
+            # Another request already logged in again after this one was sent.
+            self._logins_coalesced += 1
+            return
+        if rejected_token and rejected_token == self._mbl_token:
+            self._token_lifetime.expired(time.monotonic())
+        await self._async_single_flight_login()
+
+    async def _async_do_login(self) -> dict[str, Any]:
+        """Run the phone login request and store the new token."""
+        try:
+            return await self._async_login_request()
+        finally:
+            self._login_task = None
 
+    async def _async_login_request(self) -> dict[str, Any]:
+        """POST credentials to the login endpoint."""
         try:
             payload = await self._request(
                 "POST",
@@ -68,29 +410,76 @@ class APTiClient:
             )
 
         self._mbl_token = token
+        self._token_lifetime.issued(time.monotonic())
+        self._schedule_token_check()
         return payload
 
     async def async_check_token(self) -> dict[str, Any]:
         """Validate current session token."""
         return await self._request("POST", "/api/v2/user/check-token")
 
+    def _schedule_token_check(self) -> None:
+        """Time one token check around the predicted expiry, replacing any pending one.
+
+        The check lands shortly before the prediction and, once that passed,
+        shortly after it, so an expiry is met by check-token rather than by a
+        refresh fan-out.
+        """
+        if self._token_check is not None:
+            self._token_check.cancel()
+            self._token_check = None
+        remaining = self._token_lifetime.remaining(time.monotonic())
+        if remaining is None:
+            return
+        if remaining > TOKEN_EXPIRY_MARGIN_SECONDS:
+            delay = remaining - TOKEN_EXPIRY_MARGIN_SECONDS
+        else:
+            delay = max(0.0, remaining + TOKEN_EXPIRY_MARGIN_SECONDS)
+        self._token_check = asyncio.get_running_loop().call_later(
+            delay, self._start_token_check
+        )
+
+    def _start_token_check(self) -> None:
+        self._token_check = None
+        if self._token_check_task is None:
+            self._token_check_task = asyncio.create_task(self._async_token_check())
+
+    async def _async_token_check(self) -> None:
+        """Validate the token; a rejection renews it through the usual auth retry."""
+        token = self._mbl_token
+        try:
+            await self.async_check_token()
+        except APTiApiError as err:
+            _LOGGER.debug("APTi background token check failed: %s", err)
+            return
+        finally:
+            self._token_check_task = None
+        if token is not None and token == self._mbl_token:
+            # Accepted as is, so no login: learn from it and check again later.
+            self._token_lifetime.outlived(time.monotonic())
+            self._schedule_token_check()
+
     async def async_get_user_information_v2(self) -> dict[str, Any]:
         """Fetch user profile (v2)."""
-        return await self._request("POST", "/api/v2/user/information")
+        return await self._cached_request(
+            CACHE_GROUP_ACCOUNT, "POST", "/api/v2/user/information"
+        )
 
     async def async_get_user_information_v3(self) -> dict[str, Any] | None:
         """Fetch user profile (v3). Returns None when endpoint is unavailable."""
-        try:
-            return await self._request("GET", "/v3/api/users/information")
-        except APTiApiError:
-            return None
+        return await self._optional_request(
+            "account_v3",
+            lambda: self._cached_request(CACHE_GROUP_ACCOUNT, "GET", "/v3/api/users/information"),
+        )
 
     async def async_get_user_information_detail_v3(self) -> dict[str, Any] | None:
         """Fetch user detail profile (v3). Returns None when endpoint is unavailable."""
-        try:
-            return await self._request("GET", "/v3/api/users/information/detail")
-        except APTiApiError:
-            return None
+        return await self._optional_request(
+            "account_v3_detail",
+            lambda: self._cached_request(
+                CACHE_GROUP_ACCOUNT, "GET", "/v3/api/users/information/detail"
+            ),
+        )
 
     async def async_get_manage_home(self, bill_ym: str | None = None) -> dict[str, Any]:
         """Fetch management home summary."""
@@ -119,52 +508,137 @@ class APTiClient:
 
     async def async_get_manage_payment_next(self) -> dict[str, Any] | None:
         """Fetch next payment info."""
-        try:
-            return await self._request("GET", "/api/v2/manage/payment-next")
-        except APTiApiError:
-            return None
+        return await self._optional_request(
+            "manage_payment_next",
+            lambda: self._request("GET", "/api/v2/manage/payment-next"),
+        )
 
     async def async_get_manage_auto_discount(self) -> dict[str, Any] | None:
         """Fetch auto discount info."""
-        try:
-            return await self._request("GET", "/api/v2/manage/auto-discount")
-        except APTiApiError:
-            return None
+        return await self._optional_request(
+            "manage_auto_discount",
+            lambda: self._cached_request(
+                CACHE_GROUP_AUTO_DISCOUNT, "GET", "/api/v2/manage/auto-discount"
+            ),
+        )
 
     async def async_get_manage_energy(self) -> dict[str, Any] | None:
         """Fetch energy summary."""
-        try:
-            return await self._request("GET", "/api/v2/manage/energy")
-        except APTiApiError:
-            return None
+        return await self._optional_request(
+            "manage_energy",
+            lambda: self._request("GET", "/api/v2/manage/energy"),
+        )
 
     async def async_get_parking_visit(self, based_month: str) -> dict[str, Any] | None:
         """Fetch parking visit and reservation info."""
-        try:
-            return await self._request(
+        return await self._optional_request(
+            "parking_visit",
+            lambda: self._request(
                 "GET",
                 "/api/parking/v2/visit",
                 params={"basedMonth": based_month},
-            )
-        except APTiApiError:
-            return None
+            ),
+        )
 
     async def async_get_parking_favorites(self) -> list[dict[str, Any]] | None:
         """Fetch parking favorites."""
-        try:
-            data = await self._request("POST", "/api/parking/v2/favorites", json_body={})
-        except APTiApiError:
-            return None
+        data = await self._optional_request(
+            "parking_favorites",
+            lambda: self._request("POST", "/api/parking/v2/favorites", json_body={}),
+        )
         if isinstance(data, list):
             return [row for row in data if isinstance(row, dict)]
         return None
 
     async def async_get_parking_application_status(self) -> dict[str, Any] | None:
         """Fetch parking application status."""
+        return await self._optional_request(
+            "parking_application_status",
+            lambda: self._cached_request(
+                CACHE_GROUP_PARKING_APPLICATION, "POST", "/api/parking/v2/application/status"
+            ),
+        )
+
+    async def _optional_request(
+        self, endpoint: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any | None:
+        """Call an endpoint some complexes do not support, behind its circuit breaker.
+
+        Errors count towards opening the breaker, except authentication
+        failures, which yield None. An endpoint answering with errors yields
+        None. Throttling and transport errors, and timeouts reported through
+        ``record_timeout``, are transient: they are raised, and trip the
+        breaker only after a longer streak. While tripped that way, calls
+        fail without a request.
+        """
+        if not self._breakers.allow(endpoint, time.time()):
+            if self._breakers.unsupported(endpoint):
+                return None
+            raise APTiRetryableError(f"{endpoint} paused after repeated transient failures")
         try:
-            return await self._request("POST", "/api/parking/v2/application/status")
-        except APTiApiError:
+            payload = await fetch()
+        except APTiAuthError:
+            return None
+        except APTiRetryableError:
+            self._breakers.record_failure(endpoint, time.time(), transient=True)
+            raise
+        except APTiApiError as err:
+            self._breakers.record_failure(endpoint, time.time())
+            _LOGGER.debug("APTi optional endpoint %s failed: %s", endpoint, err)
             return None
+        self._breakers.record_success(endpoint)
+        return payload
+
+    async def _cached_request(
+        self, group: str, method: str, path: str
+    ) -> dict[str, Any] | list[Any]:
+        """Serve a slow-changing endpoint from the TTL cache, revalidating stale entries."""
+        ttl = self._cache_ttls.get(group, 0.0)
+        if ttl <= 0:
+            return await self._request(method, path)
+
+        cache_key = f"{method} {path}"
+        now = time.monotonic()
+        entry = self._response_cache.get(cache_key)
+        if entry is not None:
+            age = now - entry.fetched_at
+            if age < ttl:
+                self._response_cache.hits += 1
+                return entry.payload
+            if age < ttl * STALE_WHILE_REVALIDATE_FACTOR:
+                self._response_cache.stale_hits += 1
+                self._schedule_revalidation(
+                    cache_key, lambda: self._async_fetch_into_cache(cache_key, method, path)
+                )
+                return entry.payload
+
+        self._response_cache.misses += 1
+        return await self._async_fetch_into_cache(cache_key, method, path)
+
+    async def _async_fetch_into_cache(
+        self, cache_key: str, method: str, path: str
+    ) -> dict[str, Any] | list[Any]:
+        """Fetch an endpoint and store the payload in the TTL cache."""
+        payload = await self._request(method, path)
+        self._response_cache.set(cache_key, payload, time.monotonic())
+        return payload
+
+    def _schedule_revalidation(
+        self, cache_key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Refresh a stale cache entry in the background, once per key."""
+        if cache_key in self._revalidating:
+            return
+
+        async def _revalidate() -> None:
+            try:
+                await fetch()
+            except APTiApiError as err:
+                _LOGGER.debug("APTi background revalidation of %s failed: %s", cache_key, err)
+            finally:
+                self._revalidating.pop(cache_key, None)
+
+        self._revalidating[cache_key] = asyncio.create_task(_revalidate())
 
     async def _request(
         self,
@@ -176,19 +650,94 @@ class APTiClient:
         auth_required: bool = True,
         retry_on_auth: bool = True,
     ) -> dict[str, Any] | list[Any]:
-        """Execute an API request with optional one-time auth retry."""
+        """Execute an API request with optional one-time auth retry.
+
+        GETs that are throttled, fail server-side or hit a transport error are
+        retried with jittered exponential backoff, or after ``Retry-After``.
+        """
         if auth_required and not self._mbl_token:
             await self.async_login()
-
-        url = str(URL(API_BASE_URL).with_path(path))
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": "HomeAssistant-APTi/0.1",
-        }
-        if auth_required and self._mbl_token:
-            headers["mbl-token"] = self._mbl_token
-
+        sent_token = self._mbl_token if auth_required else None
+
+        url = _endpoint_url(path)
+        headers = _HEADER_TEMPLATE.copy()
+        if sent_token:
+            headers["mbl-token"] = sent_token
+
+        cache_key: str | None = None
+        cached: ConditionalCacheEntry | None = None
+        if method == "GET":
+            cache_key = self._conditional_cache_key(path, params)
+            cached = self._conditional_cache.get(cache_key)
+            if cached is not None:
+                self._conditional_requests += 1
+                if cached.etag:
+                    headers[hdrs.IF_NONE_MATCH] = cached.etag
+                if cached.last_modified:
+                    headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
+        attempt = 0
+        while True:
+            try:
+                async with self._limiter.slot():
+                    return await self._async_send(
+                        method,
+                        path,
+                        url,
+                        params=params,
+                        json_body=json_body,
+                        headers=headers,
+                        cache_key=cache_key,
+                        cached=cached,
+                        retry_on_auth=auth_required and retry_on_auth,
+                    )
+            except _TokenRejectedError:
+                break
+            except APTiRetryableError as err:
+                if method != "GET" or attempt >= MAX_RETRIES:
+                    raise
+                delay = err.retry_after
+                if delay is None:
+                    delay = random.uniform(0, RETRY_BASE_DELAY_SECONDS * 2**attempt)
+                attempt += 1
+                self._retries += 1
+                _LOGGER.debug(
+                    "APTi retrying %s %s in %.1fs (attempt %s): %s",
+                    method,
+                    path,
+                    delay,
+                    attempt,
+                    err,
+                )
+                await asyncio.sleep(delay)
+
+        # Renew outside the limiter slot: the login itself needs one.
+        await self._async_renew_token(sent_token)
+        return await self._request(
+            method,
+            path,
+            params=params,
+            json_body=json_body,
+            auth_required=auth_required,
+            retry_on_auth=False,
+        )
+
+    async def _async_send(
+        self,
+        method: str,
+        path: str,
+        url: URL,
+        *,
+        params: dict[str, Any] | None,
+        json_body: dict[str, Any] | None,
+        headers: dict[str, str],
+        cache_key: str | None,
+        cached: ConditionalCacheEntry | None,
+        retry_on_auth: bool,
+    ) -> dict[str, Any] | list[Any]:
+        """Send one request and decode its response."""
+        self._transfer_counter(method, path).requests += 1
+        started = time.monotonic()
         try:
             async with self._session.request(
                 method=method,
@@ -198,19 +747,26 @@ class APTiClient:
                 headers=headers,
                 timeout=DEFAULT_TIMEOUT_SECONDS,
             ) as response:
-                payload = await self._decode_json(response)
-
-                if auth_required and retry_on_auth and self._is_auth_failure(response.status, payload):
-                    await self.async_login(force=True)
-                    return await self._request(
-                        method,
-                        path,
-                        params=params,
-                        json_body=json_body,
-                        auth_required=auth_required,
-                        retry_on_auth=False,
+                if response.status == 304 and cached is not None:
+                    self._limiter.on_success(time.monotonic() - started)
+                    self._conditional_hits += 1
+                    self._conditional_bytes_saved += cached.size
+                    return cached.payload
+
+                if response.status == 429 or response.status >= 500:
+                    retry_after = _parse_retry_after(response.headers.get(hdrs.RETRY_AFTER))
+                    self._limiter.on_throttle(retry_after)
+                    raise APTiRetryableError(
+                        f"HTTP {response.status} {path}", retry_after=retry_after
                     )
 
+                body = await response.read()
+                self._record_transfer(method, path, response, body)
+                payload = self._decode_json(body)
+
+                if retry_on_auth and self._is_auth_failure(response.status, payload):
+                    raise _TokenRejectedError
+
                 if response.status >= 400:
                     message = self._extract_error_message(payload)
                     detail = f"{message} (HTTP {response.status} {path})"
@@ -218,20 +774,64 @@ class APTiClient:
                         raise APTiAuthError(detail)
                     raise APTiApiError(detail)
 
+                self._limiter.on_success(time.monotonic() - started)
+                if cache_key is not None:
+                    self._remember_validators(cache_key, response, payload, len(body))
                 return payload
-        except APTiAuthError:
-            raise
         except (ClientError, ClientResponseError, TimeoutError) as err:
-            raise APTiApiError(str(err)) from err
-
-    async def _decode_json(self, response) -> dict[str, Any] | list[Any]:
+            self._limiter.on_throttle()
+            raise APTiRetryableError(str(err)) from err
+
+    def _transfer_counter(self, method: str, path: str) -> TransferCounter:
+        """Return the transfer counters of an endpoint, creating them on first use."""
+        endpoint = f"{method} {_BILL_YM_SEGMENT.sub('/{bill_ym}', path)}"
+        counter = self._transfers.get(endpoint)
+        if counter is None:
+            counter = self._transfers[endpoint] = TransferCounter()
+        return counter
+
+    def _record_transfer(
+        self, method: str, path: str, response: ClientResponse, body: bytes
+    ) -> None:
+        """Add a response body to its endpoint's transfer counters."""
+        self._transfer_counter(method, path).record(response, body)
+
+    @staticmethod
+    def _conditional_cache_key(path: str, params: dict[str, Any] | None) -> str:
+        """Return the validator cache key for a GET endpoint."""
+        if not params:
+            return path
+        query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+        return f"{path}?{query}"
+
+    def _remember_validators(
+        self,
+        cache_key: str,
+        response: ClientResponse,
+        payload: dict[str, Any] | list[Any],
+        size: int,
+    ) -> None:
+        """Store ETag/Last-Modified validators of a full response."""
+        etag = response.headers.get(hdrs.ETAG)
+        last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        if not etag and not last_modified:
+            self._conditional_cache.pop(cache_key, None)
+            return
+        self._conditional_cache[cache_key] = ConditionalCacheEntry(
+            etag=etag,
+            last_modified=last_modified,
+            payload=payload,
+            size=size,
+        )
+
+    def _decode_json(self, body: bytes) -> dict[str, Any] | list[Any]:
         """Decode JSON payload; if body is empty return an empty dict."""
-        text = await response.text()
-        if not text:
+        if not body:
             return {}
         try:
-            parsed = await response.json(content_type=None)
+            parsed = json_loads(body)
         except ValueError as err:
+            text = body[:640].decode("utf-8", errors="replace")
             raise APTiApiError(f"Non-JSON response: {text[:160]}") from err
         if isinstance(parsed, (dict, list)):
             return parsed
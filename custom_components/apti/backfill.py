@@ -0,0 +1,135 @@
+"""Historical bill backfill for the APTi integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .api import APTiApiError
+from .const import DOMAIN
+from .storage import APTiBillArchive
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKFILL_CONCURRENCY = 2
+
+
+def previous_bill_months(bill_ym: str, count: int) -> list[str]:
+    """Return the ``count`` billing months before ``bill_ym``, newest first."""
+    year, month = int(bill_ym[:4]), int(bill_ym[4:6])
+    months: list[str] = []
+    for _ in range(count):
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+        months.append(f"{year:04d}{month:02d}")
+    return months
+
+
+class APTiBillBackfill:
+    """Pull past billing months into the bill archive without blocking setup.
+
+    Months already in the archive are skipped, so an interrupted run resumes
+    where it stopped on the next start.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        bill_archive: APTiBillArchive,
+        months: int,
+        concurrency: int = BACKFILL_CONCURRENCY,
+    ) -> None:
+        self._hass = hass
+        self._bill_archive = bill_archive
+        self._months = months
+        self._concurrency = concurrency
+        self._listeners: list[CALLBACK_TYPE] = []
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.running = False
+
+    @property
+    def progress(self) -> int:
+        """Return completion in percent."""
+        if not self.total:
+            return 100
+        return int((self.done + self.failed) * 100 / self.total)
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return progress details."""
+        return {
+            "months": self._months,
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "running": self.running,
+        }
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for progress updates."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_start(self, entry: ConfigEntry) -> None:
+        """Start the backfill as a background task of the config entry."""
+        entry.async_create_background_task(
+            self._hass, self._async_run(), f"{DOMAIN}_bill_backfill"
+        )
+
+    async def _async_run(self) -> None:
+        """Fetch every missing month with bounded concurrency."""
+        targets = previous_bill_months(self._bill_archive.current_bill_ym(), self._months)
+        pending = [bill_ym for bill_ym in targets if not self._bill_archive.has_month(bill_ym)]
+        self.total = len(targets)
+        self.done = self.total - len(pending)
+        self.failed = 0
+        if not pending:
+            self._async_notify()
+            return
+
+        self.running = True
+        self._async_notify()
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _fetch(bill_ym: str) -> None:
+            async with semaphore:
+                try:
+                    await self._bill_archive.async_get_manage_home(bill_ym)
+                    await self._bill_archive.async_get_management_fee_history(bill_ym)
+                except APTiApiError as err:
+                    _LOGGER.debug("APTi backfill of %s failed: %s", bill_ym, err)
+                    self.failed += 1
+                else:
+                    self.done += 1
+            self._async_notify()
+
+        try:
+            await asyncio.gather(*(_fetch(bill_ym) for bill_ym in pending))
+        finally:
+            self.running = False
+            self._async_notify()
+        _LOGGER.debug(
+            "APTi backfill finished: %s of %s months archived, %s failed",
+            self.done,
+            self.total,
+            self.failed,
+        )
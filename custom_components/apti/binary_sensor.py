@@ -11,13 +11,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .coordinator import APTiDataUpdateCoordinator
+from .coordinator import APTiDataUpdateCoordinator, coordinator_key
 from .entity import (
     AptiCoordinatorEntity,
     DEVICE_ACCOUNT,
     DEVICE_MANAGEMENT_FEE,
     DEVICE_PARKING,
 )
+from .models import APTiSnapshot
 
 
 def _yn_to_bool(value: Any) -> bool | None:
@@ -37,9 +38,10 @@ class AptiBinarySensorDescription:
 
     key: str
     name: str
-    value_fn: Callable[[dict[str, Any]], bool | None]
+    value_fn: Callable[[APTiSnapshot], bool | None]
     icon: str | None = None
     device_key: str = DEVICE_ACCOUNT
+    sections: tuple[str, ...] = ()
 
 
 DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
@@ -48,6 +50,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="관리비 납부완료",
         icon="mdi:check-decagram",
         device_key=DEVICE_MANAGEMENT_FEE,
+        sections=("management_fee",),
         value_fn=lambda d: bool(d.get("management_fee", {}).get("paymentCompleted")),
     ),
     AptiBinarySensorDescription(
@@ -55,6 +58,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="관리비 자동이체",
         icon="mdi:bank-check",
         device_key=DEVICE_MANAGEMENT_FEE,
+        sections=("manage_home",),
         value_fn=lambda d: _yn_to_bool(d.get("manage_home", {}).get("autoTransferYN")),
     ),
     AptiBinarySensorDescription(
@@ -62,6 +66,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="전자고지",
         icon="mdi:email-fast",
         device_key=DEVICE_ACCOUNT,
+        sections=("account",),
         value_fn=lambda d: _yn_to_bool(d.get("account", {}).get("electronicBill")),
     ),
     AptiBinarySensorDescription(
@@ -69,6 +74,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="주차 서비스 사용가능",
         icon="mdi:car-connected",
         device_key=DEVICE_PARKING,
+        sections=("parking_visit",),
         value_fn=lambda d: bool(d.get("parking_visit", {}).get("serviceYn")),
     ),
     AptiBinarySensorDescription(
@@ -76,6 +82,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="주차 예약제 운영",
         icon="mdi:calendar-clock",
         device_key=DEVICE_PARKING,
+        sections=("parking_visit",),
         value_fn=lambda d: bool(d.get("parking_visit", {}).get("isReservation")),
     ),
     AptiBinarySensorDescription(
@@ -83,6 +90,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="주차 예약 가능",
         icon="mdi:car-key",
         device_key=DEVICE_PARKING,
+        sections=("parking_visit",),
         value_fn=lambda d: bool(d.get("parking_visit", {}).get("isReservable")),
     ),
     AptiBinarySensorDescription(
@@ -90,6 +98,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="공휴일 예외 적용",
         icon="mdi:calendar-alert",
         device_key=DEVICE_PARKING,
+        sections=("parking_visit",),
         value_fn=lambda d: _yn_to_bool(
             d.get("parking_visit", {}).get("exceptions", {}).get("exHolidayUseYn")
         ),
@@ -99,6 +108,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="토요일 예외 적용",
         icon="mdi:calendar-weekend",
         device_key=DEVICE_PARKING,
+        sections=("parking_visit",),
         value_fn=lambda d: _yn_to_bool(
             d.get("parking_visit", {}).get("exceptions", {}).get("exSatUseYn")
         ),
@@ -108,6 +118,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="일요일 예외 적용",
         icon="mdi:calendar-weekend-outline",
         device_key=DEVICE_PARKING,
+        sections=("parking_visit",),
         value_fn=lambda d: _yn_to_bool(
             d.get("parking_visit", {}).get("exceptions", {}).get("exSunUseYn")
         ),
@@ -117,6 +128,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="주차 서비스 운영 단지",
         icon="mdi:office-building-check",
         device_key=DEVICE_PARKING,
+        sections=("parking_application_status",),
         value_fn=lambda d: _yn_to_bool(
             d.get("parking_application_status", {}).get("isInOperationApt")
         ),
@@ -126,6 +138,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="주차 서비스 신청 완료",
         icon="mdi:clipboard-check",
         device_key=DEVICE_PARKING,
+        sections=("parking_application_status",),
         value_fn=lambda d: _yn_to_bool(d.get("parking_application_status", {}).get("isApplied")),
     ),
     AptiBinarySensorDescription(
@@ -133,6 +146,7 @@ DESCRIPTIONS: tuple[AptiBinarySensorDescription, ...] = (
         name="방문차량 주차중",
         icon="mdi:car",
         device_key=DEVICE_PARKING,
+        sections=("parking_visit",),
         value_fn=lambda d: (d.get("parking_visit", {}).get("parkedTime") or 0) > 0,
     ),
 )
@@ -152,14 +166,15 @@ class AptiBinarySensor(AptiCoordinatorEntity, BinarySensorEntity):
             config_entry,
             f"binary_{description.key}",
             device_key=description.device_key,
+            sections=description.sections,
         )
-        self.entity_description = description
+        self._description = description
         self._attr_name = description.name
         self._attr_icon = description.icon
 
     @property
     def is_on(self) -> bool | None:
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._description.value_fn(self.coordinator.snapshot)
 
 
 async def async_setup_entry(
@@ -168,7 +183,15 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up APTi binary sensors."""
-    coordinator: APTiDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    async_add_entities(
-        AptiBinarySensor(coordinator, config_entry, description) for description in DESCRIPTIONS
-    )
+    coordinators: dict[str, APTiDataUpdateCoordinator] = hass.data[DOMAIN][
+        config_entry.entry_id
+    ]["coordinators"]
+    entities: list[AptiBinarySensor] = []
+    for description in DESCRIPTIONS:
+        coordinator = coordinators.get(
+            coordinator_key(description.sections, description.device_key)
+        )
+        # Missing when fetching of the category is disabled in options.
+        if coordinator is not None:
+            entities.append(AptiBinarySensor(coordinator, config_entry, description))
+    async_add_entities(entities)
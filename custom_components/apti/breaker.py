@@ -0,0 +1,132 @@
+"""Per-endpoint circuit breakers for optional APTi endpoints."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# Consecutive failures after which an endpoint is treated as unsupported.
+FAILURE_THRESHOLD = 3
+# Consecutive timeouts, throttling or transport errors after which calls pause too.
+TRANSIENT_FAILURE_THRESHOLD = 6
+INITIAL_PROBE_DELAY_SECONDS = 3600.0
+MAX_PROBE_DELAY_SECONDS = 7 * 24 * 3600.0
+
+
+@dataclass(slots=True)
+class EndpointBreaker:
+    """Failure state of one endpoint, in wall-clock seconds so it survives restarts."""
+
+    failures: int = 0
+    transient_failures: int = 0
+    open_until: float = 0.0
+    probe_delay: float = 0.0
+
+    @property
+    def unsupported(self) -> bool:
+        """Return True once the endpoint kept answering with errors."""
+        return self.failures >= FAILURE_THRESHOLD
+
+    @property
+    def tripped(self) -> bool:
+        """Return True once the endpoint failed often enough to stop calling it."""
+        return self.unsupported or self.transient_failures >= TRANSIENT_FAILURE_THRESHOLD
+
+    def allow(self, now: float) -> bool:
+        """Return True when a call, or a probe of an open breaker, may go out."""
+        return now >= self.open_until
+
+    def record_failure(self, now: float, *, transient: bool = False) -> None:
+        """Count a failure; open, or keep open with a doubled probe delay."""
+        if transient:
+            self.transient_failures += 1
+        else:
+            self.failures += 1
+        if not self.tripped:
+            return
+        self.probe_delay = (
+            min(self.probe_delay * 2, MAX_PROBE_DELAY_SECONDS)
+            if self.probe_delay
+            else INITIAL_PROBE_DELAY_SECONDS
+        )
+        self.open_until = now + self.probe_delay
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.transient_failures = 0
+        self.open_until = 0.0
+        self.probe_delay = 0.0
+
+
+class CircuitBreakers:
+    """Breakers of every optional endpoint of one account."""
+
+    def __init__(self) -> None:
+        self._breakers: dict[str, EndpointBreaker] = {}
+        self.skipped = 0
+
+    def allow(self, endpoint: str, now: float) -> bool:
+        """Return True when the endpoint may be called."""
+        breaker = self._breakers.get(endpoint)
+        if breaker is None or breaker.allow(now):
+            return True
+        self.skipped += 1
+        return False
+
+    def unsupported(self, endpoint: str) -> bool:
+        """Return True when the endpoint kept answering with errors."""
+        breaker = self._breakers.get(endpoint)
+        return breaker is not None and breaker.unsupported
+
+    def record_failure(self, endpoint: str, now: float, *, transient: bool = False) -> None:
+        """Count a failure of an endpoint."""
+        self._breakers.setdefault(endpoint, EndpointBreaker()).record_failure(
+            now, transient=transient
+        )
+
+    def record_success(self, endpoint: str) -> None:
+        """Close an endpoint's breaker."""
+        breaker = self._breakers.get(endpoint)
+        if breaker is not None:
+            breaker.record_success()
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """Return breakers with failures, for persistence."""
+        return {
+            endpoint: asdict(breaker)
+            for endpoint, breaker in self._breakers.items()
+            if breaker.failures or breaker.transient_failures
+        }
+
+    def restore(self, saved: dict[str, Any] | None) -> None:
+        """Load persisted breakers."""
+        for endpoint, state in (saved or {}).items():
+            if not isinstance(state, dict):
+                continue
+            try:
+                self._breakers[endpoint] = EndpointBreaker(
+                    failures=int(state.get("failures", 0)),
+                    transient_failures=int(state.get("transient_failures", 0)),
+                    open_until=float(state.get("open_until", 0.0)),
+                    probe_delay=float(state.get("probe_delay", 0.0)),
+                )
+            except (TypeError, ValueError):
+                continue
+
+    def state(self, now: float) -> dict[str, Any]:
+        """Return breaker state for diagnostics."""
+        return {
+            "skipped_calls": self.skipped,
+            "endpoints": {
+                endpoint: {
+                    "failures": breaker.failures,
+                    "transient_failures": breaker.transient_failures,
+                    "unsupported": breaker.unsupported,
+                    "tripped": breaker.tripped,
+                    "next_probe_in_seconds": round(max(0.0, breaker.open_until - now)),
+                }
+                for endpoint, breaker in self._breakers.items()
+                if breaker.failures or breaker.transient_failures
+            },
+        }
@@ -0,0 +1,62 @@
+"""Response caching helpers for the APTi client."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_MAX_ENTRIES = 64
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Parsed payload and the monotonic time it was fetched."""
+
+    payload: dict[str, Any] | list[Any]
+    fetched_at: float
+
+
+class ResponseCache:
+    """Bounded LRU cache of parsed API responses."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return cache counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return a cached response and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, payload: dict[str, Any] | list[Any], now: float) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        self._entries[key] = CachedResponse(payload=payload, fetched_at=now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
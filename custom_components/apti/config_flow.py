@@ -8,12 +8,30 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
-from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import APTiApiError, APTiAuthError, APTiClient
-from .const import DEFAULT_SCAN_INTERVAL_MINUTES, DOMAIN
+from .const import (
+    CONF_BACKFILL_MONTHS,
+    CONF_CACHE_TTL_ACCOUNT,
+    CONF_CACHE_TTL_AUTO_DISCOUNT,
+    CONF_CACHE_TTL_PARKING_APPLICATION,
+    CONF_DEDICATED_SESSION,
+    CONF_DISABLED_CATEGORIES,
+    CONF_PARKING_DAILY_BUDGET,
+    CONF_SCAN_INTERVALS,
+    DEFAULT_BACKFILL_MONTHS,
+    DEFAULT_CACHE_TTL_MINUTES,
+    DEFAULT_DEDICATED_SESSION,
+    DEFAULT_PARKING_DAILY_BUDGET,
+    DEFAULT_SCAN_INTERVALS_MINUTES,
+    DOMAIN,
+    OPTIONAL_CATEGORIES,
+)
+from .entity import DEVICE_DESCRIPTORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,15 +57,19 @@ async def _validate_login(
     if isinstance(info_v2, dict):
         info = info_v2
 
-    if info is None:
-        info_v3 = await client.async_get_user_information_v3()
-        if isinstance(info_v3, dict):
-            info = info_v3
-
-    if info is None:
-        info_v3_detail = await client.async_get_user_information_detail_v3()
-        if isinstance(info_v3_detail, dict):
-            info = info_v3_detail
+    for fetch in (
+        client.async_get_user_information_v3,
+        client.async_get_user_information_detail_v3,
+    ):
+        if info is not None:
+            break
+        try:
+            profile = await fetch()
+        except APTiApiError as err:
+            _LOGGER.debug("APTi v3 profile lookup failed during config validation: %s", err)
+            profile = None
+        if isinstance(profile, dict):
+            info = profile
 
     if info is None:
         info = {"userId": login_payload.get("userId") or data[CONF_USERNAME]}
@@ -70,7 +92,7 @@ def _build_entry_title(info: dict[str, Any], fallback: str) -> str:
 class APTiConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for APTi."""
 
-    VERSION = 1
+    VERSION = 2
 
     @staticmethod
     @callback
@@ -126,15 +148,51 @@ class APTiOptionsFlow(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema({
+        options = self._config_entry.options
+        schema: dict[Any, Any] = {}
+        for category, option in CONF_SCAN_INTERVALS.items():
+            schema[
                 vol.Required(
-                    CONF_SCAN_INTERVAL, 
-                    default=self._config_entry.options.get(
-                        CONF_SCAN_INTERVAL,
-                        DEFAULT_SCAN_INTERVAL_MINUTES,
-                    ),
-                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=120)),
-            }),
+                    option,
+                    default=options.get(option, DEFAULT_SCAN_INTERVALS_MINUTES[category]),
+                )
+            ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=1440))
+        schema[
+            vol.Required(
+                CONF_PARKING_DAILY_BUDGET,
+                default=options.get(CONF_PARKING_DAILY_BUDGET, DEFAULT_PARKING_DAILY_BUDGET),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=72, max=4320))
+        for option in (
+            CONF_CACHE_TTL_ACCOUNT,
+            CONF_CACHE_TTL_PARKING_APPLICATION,
+            CONF_CACHE_TTL_AUTO_DISCOUNT,
+        ):
+            schema[
+                vol.Required(
+                    option,
+                    default=options.get(option, DEFAULT_CACHE_TTL_MINUTES[option]),
+                )
+            ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=10080))
+        schema[
+            vol.Required(
+                CONF_BACKFILL_MONTHS,
+                default=options.get(CONF_BACKFILL_MONTHS, DEFAULT_BACKFILL_MONTHS),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=60))
+        schema[
+            vol.Required(
+                CONF_DEDICATED_SESSION,
+                default=options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION),
+            )
+        ] = bool
+        schema[
+            vol.Optional(
+                CONF_DISABLED_CATEGORIES,
+                default=options.get(CONF_DISABLED_CATEGORIES, []),
+            )
+        ] = cv.multi_select(
+            {category: DEVICE_DESCRIPTORS[category].name for category in OPTIONAL_CATEGORIES}
         )
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
@@ -2,16 +2,74 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-
 from homeassistant.const import Platform
 
 DOMAIN = "apti"
 NAME = "APTi"
 MANUFACTURER = "APTi"
-DEFAULT_SCAN_INTERVAL_MINUTES = 15
-DEFAULT_SCAN_INTERVAL = timedelta(minutes=DEFAULT_SCAN_INTERVAL_MINUTES)
 API_BASE_URL = "https://api-main.apti.co.kr"
+EVENT_BILL_PUBLISHED = f"{DOMAIN}_bill_published"
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 PAYMENT_STATE_CODES: tuple[str, ...] = ("001", "002", "003", "004", "005")
 
+DEVICE_ACCOUNT = "account"
+DEVICE_MANAGEMENT_FEE = "management_fee"
+DEVICE_PARKING = "parking"
+DEVICE_PAYMENT = "payment"
+DEVICE_ENERGY = "energy"
+DEVICE_SYSTEM = "system"
+
+# Device groups polled by their own coordinator, with the data sections each one owns.
+COORDINATOR_SECTIONS: dict[str, tuple[str, ...]] = {
+    DEVICE_ACCOUNT: ("account",),
+    DEVICE_MANAGEMENT_FEE: ("manage_home", "management_fee", "manage_auto_discount"),
+    DEVICE_PAYMENT: ("manage_payment_next", "payment_histories"),
+    DEVICE_ENERGY: ("manage_energy",),
+    DEVICE_PARKING: (
+        "parking_visit",
+        "parking_application_status",
+        "parking_favorites",
+        "based_month",
+        "fetched_at",
+    ),
+}
+
+CONF_SCAN_INTERVALS: dict[str, str] = {
+    DEVICE_ACCOUNT: "scan_interval_account",
+    DEVICE_MANAGEMENT_FEE: "scan_interval_management_fee",
+    DEVICE_PAYMENT: "scan_interval_payment",
+    DEVICE_ENERGY: "scan_interval_energy",
+    DEVICE_PARKING: "scan_interval_parking",
+}
+DEFAULT_SCAN_INTERVALS_MINUTES: dict[str, int] = {
+    DEVICE_ACCOUNT: 1440,
+    DEVICE_MANAGEMENT_FEE: 60,
+    DEVICE_PAYMENT: 360,
+    DEVICE_ENERGY: 720,
+    DEVICE_PARKING: 2,
+}
+
+# Device groups whose fetching can be turned off; account and fee data are always needed.
+CONF_DISABLED_CATEGORIES = "disabled_categories"
+OPTIONAL_CATEGORIES: tuple[str, ...] = (DEVICE_PAYMENT, DEVICE_ENERGY, DEVICE_PARKING)
+
+CONF_PARKING_DAILY_BUDGET = "parking_daily_budget"
+# Parking requests per day; a poll sends two, plus the cached application status.
+DEFAULT_PARKING_DAILY_BUDGET = 600
+
+
+CONF_CACHE_TTL_ACCOUNT = "cache_ttl_account"
+CONF_CACHE_TTL_PARKING_APPLICATION = "cache_ttl_parking_application"
+CONF_CACHE_TTL_AUTO_DISCOUNT = "cache_ttl_auto_discount"
+DEFAULT_CACHE_TTL_MINUTES: dict[str, int] = {
+    CONF_CACHE_TTL_ACCOUNT: 360,
+    CONF_CACHE_TTL_PARKING_APPLICATION: 360,
+    CONF_CACHE_TTL_AUTO_DISCOUNT: 720,
+}
+
+# Use a keep-alive session shared by all APTi entries instead of Home Assistant's.
+CONF_DEDICATED_SESSION = "dedicated_session"
+DEFAULT_DEDICATED_SESSION = False
+
+CONF_BACKFILL_MONTHS = "backfill_months"
+DEFAULT_BACKFILL_MONTHS = 24
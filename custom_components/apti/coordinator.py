@@ -3,29 +3,96 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from functools import partial
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import APTiApiError, APTiAuthError, APTiClient
-from .const import DOMAIN, PAYMENT_STATE_CODES
+from .api import PARKING_PATH_PREFIX, APTiApiError, APTiAuthError, APTiClient
+from .const import (
+    CONF_PARKING_DAILY_BUDGET,
+    COORDINATOR_SECTIONS,
+    DEFAULT_PARKING_DAILY_BUDGET,
+    DEVICE_ACCOUNT,
+    DEVICE_ENERGY,
+    DEVICE_MANAGEMENT_FEE,
+    DEVICE_PARKING,
+    DEVICE_PAYMENT,
+    DOMAIN,
+    EVENT_BILL_PUBLISHED,
+    PAYMENT_STATE_CODES,
+)
+from .helpers import parse_yyyymmdd, safe_int, safe_text
+from .models import APTiSnapshot, changed_paths, payment_section
+from .scheduler import (
+    BILLING_SPARSE_INTERVAL,
+    PARKING_IDLE_MAX_INTERVAL,
+    AdaptivePollPolicy,
+    BillingCyclePolicy,
+    parking_active,
+)
+from .storage import APTiBillArchive, APTiStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Overall budget of one coordinator refresh, and per call budgets of its endpoints.
+REFRESH_DEADLINE_SECONDS = 45
+ENDPOINT_TIMEOUT_SECONDS = 30
+OPTIONAL_ENDPOINT_TIMEOUT_SECONDS = 10
+
+
+@dataclass(slots=True)
+class StateWriteStats:
+    """Entity state writes performed versus suppressed as unchanged."""
+
+    performed: int = 0
+    suppressed: int = 0
+    total_performed: int = 0
+    total_suppressed: int = 0
+
+    def record(self, *, written: bool) -> None:
+        """Count one entity update."""
+        if written:
+            self.performed += 1
+            self.total_performed += 1
+        else:
+            self.suppressed += 1
+            self.total_suppressed += 1
+
+    def as_dict(self) -> dict[str, int]:
+        """Return counters for diagnostics."""
+        return asdict(self)
+
 
 class APTiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Fetch and merge APTi API payloads."""
+    """Fetch one device group's APTi payloads on its own schedule.
+
+    Subclasses set ``category`` and implement ``_async_fetch``.
+    """
+
+    category: str
+    poll_policy: AdaptivePollPolicy | BillingCyclePolicy | None = None
+    # Endpoints fetched even when no enabled entity reads them.
+    required_endpoints: frozenset[str] = frozenset()
+    # Endpoints given the full call budget; the rest are cut off sooner.
+    primary_endpoints: frozenset[str] = frozenset()
 
     def __init__(
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         client: APTiClient,
+        store: APTiStore,
+        bill_archive: APTiBillArchive,
         update_interval,
     ) -> None:
         """Initialize coordinator."""
@@ -33,13 +100,149 @@ class APTiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             config_entry=config_entry,
-            name=DOMAIN,
+            name=f"{DOMAIN}_{self.category}",
             update_interval=update_interval,
         )
         self._client = client
+        self._store = store
+        self._bill_archive = bill_archive
+        self._snapshot: APTiSnapshot | None = None
+        self.write_stats = StateWriteStats()
+        self._notified_snapshot: APTiSnapshot | None = None
+        self._notified_success: bool | None = None
+        self._errors: dict[str, str] = {}
+        self._readers: dict[str, frozenset[str]] = {}
+        self._needed: set[str] | None = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only listeners whose data paths changed since the last round.
+
+        Listeners registered without a context, and every listener when
+        availability flips, are always notified.
+        """
+        self.write_stats.performed = 0
+        self.write_stats.suppressed = 0
+
+        snapshot = self.snapshot
+        changed: set[str] | None = None
+        if (
+            self._notified_snapshot is not None
+            and self._notified_success == self.last_update_success
+        ):
+            changed = changed_paths(self._notified_snapshot, snapshot)
+        self._notified_snapshot = snapshot
+        self._notified_success = self.last_update_success
+
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not context.isdisjoint(changed):
+                update_callback()
+
+        _LOGGER.debug(
+            "APTi %s changed paths: %s; state writes: %s performed, %s suppressed",
+            self.category,
+            "all" if changed is None else sorted(changed),
+            self.write_stats.performed,
+            self.write_stats.suppressed,
+        )
+
+    @property
+    def snapshot(self) -> APTiSnapshot:
+        """Return the normalized view of the current data, built once per refresh."""
+        data = self.data if self.data is not None else {}
+        if self._snapshot is None or self._snapshot.data is not data:
+            self._snapshot = APTiSnapshot.from_data(data)
+        return self._snapshot
+
+    @callback
+    def async_register_reader(self, unique_id: str, sections: Iterable[str]) -> None:
+        """Record the data paths an entity reads."""
+        self._readers[unique_id] = frozenset(sections)
+        self._needed = None
+
+    @callback
+    def async_reader_toggled(self, unique_id: str, enabled: bool) -> None:
+        """Recompute needed endpoints after an entity was enabled or disabled."""
+        if unique_id not in self._readers:
+            return
+        self._needed = None
+        if enabled and self.config_entry is not None:
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), f"{DOMAIN}_{self.category}_reader"
+            )
+
+    def _needed_paths(self) -> set[str] | None:
+        """Return data paths read by enabled entities, or None before any registered."""
+        if not self._readers or self.config_entry is None:
+            return None
+        if self._needed is None:
+            disabled = {
+                entry.unique_id
+                for entry in er.async_entries_for_config_entry(
+                    er.async_get(self.hass), self.config_entry.entry_id
+                )
+                if entry.disabled
+            }
+            self._needed = {
+                path
+                for unique_id, sections in self._readers.items()
+                if unique_id not in disabled
+                for path in sections
+            }
+        return self._needed
+
+    def _endpoint_needed(self, key: str, path: str) -> bool:
+        """Return True when an enabled entity reads what the endpoint provides."""
+        if key in self.required_endpoints:
+            return True
+        needed = self._needed_paths()
+        if needed is None:
+            return True
+        return any(
+            section == path
+            or section.startswith(f"{path}.")
+            or path.startswith(f"{section}.")
+            for section in needed
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Refresh all data required by entities."""
+        """Refresh this category's data."""
+        self._errors = {}
+        data = await self._async_fetch()
+        if self._errors:
+            _LOGGER.debug("APTi partial %s refresh errors: %s", self.category, self._errors)
+            data["partial_errors"] = self._errors
+
+        self._store.async_save_state(self._client.mbl_token, self.category, data)
+        self._store.async_save_endpoint_breakers(self._client.endpoint_breakers)
+        return data
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        """Fetch the sections owned by this coordinator."""
+        raise NotImplementedError
+
+    async def _async_fetch_all(
+        self,
+        calls: dict[str, Callable[[], Awaitable[Any]]],
+        paths: Mapping[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Run the needed endpoint calls concurrently, recording failures as partial errors.
+
+        ``paths`` maps endpoint keys to the data path they fill when it is not
+        the key itself. Endpoints no enabled entity reads are skipped. Raises
+        ``UpdateFailed`` when every called endpoint failed.
+        """
+        paths = paths or {}
+        wanted = {
+            key: call
+            for key, call in calls.items()
+            if self._endpoint_needed(key, paths.get(key, key))
+        }
+        if skipped := calls.keys() - wanted.keys():
+            _LOGGER.debug("APTi %s skipping unread endpoints: %s", self.category, sorted(skipped))
+        if not wanted:
+            return {}
+
         try:
             await self._client.async_login()
         except APTiAuthError as err:
@@ -47,95 +250,77 @@ class APTiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except APTiApiError as err:
             raise UpdateFailed(f"APTi login request failed: {err}") from err
 
-        based_month = dt_util.now().strftime("%Y%m")
-
-        tasks: dict[str, asyncio.Future] = {
-            "account_v2": asyncio.create_task(self._client.async_get_user_information_v2()),
-            "account_v3": asyncio.create_task(self._client.async_get_user_information_v3()),
-            "account_v3_detail": asyncio.create_task(
-                self._client.async_get_user_information_detail_v3()
-            ),
-            "manage_home": asyncio.create_task(self._client.async_get_manage_home()),
-            "management_fee": asyncio.create_task(
-                self._client.async_get_management_fee_history()
-            ),
-            "manage_payment_next": asyncio.create_task(
-                self._client.async_get_manage_payment_next()
-            ),
-            "manage_auto_discount": asyncio.create_task(
-                self._client.async_get_manage_auto_discount()
-            ),
-            "manage_energy": asyncio.create_task(self._client.async_get_manage_energy()),
-            "parking_visit": asyncio.create_task(self._client.async_get_parking_visit(based_month)),
-            "parking_application_status": asyncio.create_task(
-                self._client.async_get_parking_application_status()
-            ),
-            "parking_favorites": asyncio.create_task(self._client.async_get_parking_favorites()),
-        }
+        raw: dict[str, Any] = {}
+        try:
+            async with asyncio.timeout(REFRESH_DEADLINE_SECONDS):
+                await self._async_run_calls(wanted, raw)
+        except TimeoutError:
+            for key in wanted.keys() - raw.keys() - self._errors.keys():
+                self._errors[key] = f"refresh deadline of {REFRESH_DEADLINE_SECONDS}s exceeded"
+        # Unsupported optional endpoints return None and leave an empty section;
+        # when every call raised instead, keep the last good data.
+        if wanted.keys() <= self._errors.keys():
+            raise UpdateFailed(f"APTi {self.category} endpoints failed: {self._errors}")
+        return raw
 
-        for state_code in PAYMENT_STATE_CODES:
-            tasks[f"payment_{state_code}"] = asyncio.create_task(
-                self._client.async_get_management_payment_history(state_code)
-            )
+    def _endpoint_timeout(self, key: str) -> float:
+        """Return the time budget of one endpoint call."""
+        if key in self.primary_endpoints:
+            return ENDPOINT_TIMEOUT_SECONDS
+        return OPTIONAL_ENDPOINT_TIMEOUT_SECONDS
 
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    async def _async_run_calls(
+        self, calls: dict[str, Callable[[], Awaitable[Any]]], raw: dict[str, Any]
+    ) -> None:
+        """Run calls in a task group, cancelling the rest once the token is rejected."""
 
-        raw: dict[str, Any] = {}
-        errors: dict[str, str] = {}
+        async def _async_call(key: str, call: Callable[[], Awaitable[Any]]) -> None:
+            timeout = self._endpoint_timeout(key)
+            try:
+                async with asyncio.timeout(timeout):
+                    raw[key] = await call()
+            except APTiAuthError:
+                raise
+            except TimeoutError:
+                # Only this call's own budget; deadline and sibling cancellations pass through.
+                self._client.record_timeout(key)
+                self._errors[key] = f"timed out after {timeout}s"
+            except Exception as err:
+                self._errors[key] = str(err)
 
-        for key, result in zip(tasks, results, strict=False):
-            if isinstance(result, APTiAuthError):
-                raise ConfigEntryAuthFailed("APTi token rejected") from result
-            if isinstance(result, Exception):
-                errors[key] = str(result)
-                continue
-            raw[key] = result
+        try:
+            async with asyncio.TaskGroup() as group:
+                for key, call in calls.items():
+                    group.create_task(_async_call(key, call), name=f"{DOMAIN}_{key}")
+        except* APTiAuthError as err_group:
+            raise ConfigEntryAuthFailed("APTi token rejected") from err_group.exceptions[0]
 
-        manage_home = raw.get("manage_home")
-        management_fee = raw.get("management_fee")
-        if not isinstance(manage_home, dict) and not isinstance(management_fee, dict):
-            raise UpdateFailed("APTi core management endpoints returned no data")
 
-        account = self._merge_account(
-            raw.get("account_v2"), raw.get("account_v3"), raw.get("account_v3_detail")
-        )
+def _dict_or_empty(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
 
-        payment_histories: dict[str, list[dict[str, Any]]] = {}
-        for state_code in PAYMENT_STATE_CODES:
-            rows = raw.get(f"payment_{state_code}")
-            payment_histories[state_code] = rows if isinstance(rows, list) else []
 
-        data: dict[str, Any] = {
-            "account": account,
-            "manage_home": manage_home if isinstance(manage_home, dict) else {},
-            "management_fee": management_fee if isinstance(management_fee, dict) else {},
-            "manage_payment_next": raw.get("manage_payment_next")
-            if isinstance(raw.get("manage_payment_next"), dict)
-            else {},
-            "manage_auto_discount": raw.get("manage_auto_discount")
-            if isinstance(raw.get("manage_auto_discount"), dict)
-            else {},
-            "manage_energy": raw.get("manage_energy")
-            if isinstance(raw.get("manage_energy"), dict)
-            else {},
-            "parking_visit": raw.get("parking_visit")
-            if isinstance(raw.get("parking_visit"), dict)
-            else {},
-            "parking_application_status": raw.get("parking_application_status")
-            if isinstance(raw.get("parking_application_status"), dict)
-            else {},
-            "parking_favorites": raw.get("parking_favorites")
-            if isinstance(raw.get("parking_favorites"), list)
-            else [],
-            "payment_histories": payment_histories,
-            "based_month": based_month,
-        }
+class APTiAccountCoordinator(APTiDataUpdateCoordinator):
+    """Account profile, merged from the v2 and v3 endpoints."""
 
-        if errors:
-            _LOGGER.debug("APTi partial refresh errors: %s", errors)
-            data["partial_errors"] = errors
+    category = DEVICE_ACCOUNT
+    # Device names come from the account profile.
+    required_endpoints = frozenset({"account_v2", "account_v3", "account_v3_detail"})
+    primary_endpoints = frozenset({"account_v2"})
 
-        return data
+    async def _async_fetch(self) -> dict[str, Any]:
+        raw = await self._async_fetch_all(
+            {
+                "account_v2": self._client.async_get_user_information_v2,
+                "account_v3": self._client.async_get_user_information_v3,
+                "account_v3_detail": self._client.async_get_user_information_detail_v3,
+            }
+        )
+        return {
+            "account": self._merge_account(
+                raw.get("account_v2"), raw.get("account_v3"), raw.get("account_v3_detail")
+            )
+        }
 
     def _merge_account(
         self,
@@ -152,3 +337,224 @@ class APTiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if isinstance(account_v3_detail, dict):
             merged.update(account_v3_detail)
         return merged
+
+
+def _due_date(manage_home: dict[str, Any]) -> date | None:
+    payment_information = manage_home.get("paymentInformation")
+    if not isinstance(payment_information, list) or not payment_information:
+        return None
+    first = payment_information[0]
+    return parse_yyyymmdd(first.get("endDate")) if isinstance(first, dict) else None
+
+
+class APTiManagementFeeCoordinator(APTiDataUpdateCoordinator):
+    """Current bill summary, fee detail and auto discount.
+
+    The configured interval applies around the expected bill publication and
+    the due date; in between the endpoints are polled once a day.
+    """
+
+    category = DEVICE_MANAGEMENT_FEE
+    # The billing month drives the bill archive, statistics and scheduling.
+    required_endpoints = frozenset({"manage_home", "management_fee"})
+    primary_endpoints = required_endpoints
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize coordinator."""
+        super().__init__(*args, **kwargs)
+        self.poll_policy = BillingCyclePolicy(
+            dense=self.update_interval,
+            sparse=BILLING_SPARSE_INTERVAL,
+            saved=self._store.billing_cycle,
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Refresh, announce a new bill and pick the next interval."""
+        now = dt_util.now()
+        try:
+            data = await super()._async_update_data()
+        except Exception:
+            # Keep the cadence of the last known bill while the endpoints fail.
+            self._set_next_interval(now, (self.data or {}).get("manage_home", {}))
+            raise
+
+        manage_home = data["manage_home"]
+        bill_ym = safe_text(manage_home.get("billYm"))
+        previous = self.poll_policy.observe(bill_ym, now)
+        self._store.async_save_billing_cycle(self.poll_policy.as_dict())
+        if previous is not None:
+            self.hass.bus.async_fire(
+                EVENT_BILL_PUBLISHED,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "bill_ym": bill_ym,
+                    "previous_bill_ym": previous,
+                    "month_fee": safe_int(manage_home.get("monthFee")),
+                },
+            )
+        self._set_next_interval(now, manage_home)
+        return data
+
+    @callback
+    def _set_next_interval(self, now: datetime, manage_home: dict[str, Any]) -> None:
+        self.update_interval = self.poll_policy.next_interval(now, _due_date(manage_home))
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        raw = await self._async_fetch_all(
+            {
+                "manage_home": self._client.async_get_manage_home,
+                "management_fee": self._client.async_get_management_fee_history,
+                "manage_auto_discount": self._client.async_get_manage_auto_discount,
+            }
+        )
+        manage_home = raw.get("manage_home")
+        management_fee = raw.get("management_fee")
+        if not isinstance(manage_home, dict) and not isinstance(management_fee, dict):
+            raise UpdateFailed("APTi core management endpoints returned no data")
+
+        data = {
+            "manage_home": _dict_or_empty(manage_home),
+            "management_fee": _dict_or_empty(management_fee),
+            "manage_auto_discount": _dict_or_empty(raw.get("manage_auto_discount")),
+        }
+        self._bill_archive.set_current_bill_ym(data["manage_home"].get("billYm"))
+        return data
+
+
+class APTiPaymentCoordinator(APTiDataUpdateCoordinator):
+    """Upcoming payment and payment history per state code."""
+
+    category = DEVICE_PAYMENT
+    primary_endpoints = frozenset(
+        {"manage_payment_next", *(f"payment_{code}" for code in PAYMENT_STATE_CODES)}
+    )
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        calls: dict[str, Callable[[], Awaitable[Any]]] = {
+            "manage_payment_next": self._client.async_get_manage_payment_next,
+        }
+        paths: dict[str, str] = {}
+        for state_code in PAYMENT_STATE_CODES:
+            key = f"payment_{state_code}"
+            calls[key] = partial(self._client.async_get_management_payment_history, state_code)
+            paths[key] = payment_section(state_code)
+        raw = await self._async_fetch_all(calls, paths)
+
+        payment_histories: dict[str, list[dict[str, Any]]] = {}
+        for state_code in PAYMENT_STATE_CODES:
+            rows = raw.get(f"payment_{state_code}")
+            payment_histories[state_code] = rows if isinstance(rows, list) else []
+
+        return {
+            "manage_payment_next": _dict_or_empty(raw.get("manage_payment_next")),
+            "payment_histories": payment_histories,
+        }
+
+
+class APTiEnergyCoordinator(APTiDataUpdateCoordinator):
+    """Energy usage and cost of the current billing month."""
+
+    category = DEVICE_ENERGY
+    # Archived and imported into statistics whatever the enabled entities read.
+    required_endpoints = frozenset({"manage_energy"})
+    primary_endpoints = required_endpoints
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        raw = await self._async_fetch_all(
+            {"manage_energy": self._client.async_get_manage_energy}
+        )
+        data = {"manage_energy": _dict_or_empty(raw.get("manage_energy"))}
+
+        # Archive under the month the fee coordinator saw published, never a guess.
+        bill_ym = self._bill_archive.published_bill_ym
+        if bill_ym:
+            self._bill_archive.async_record_open_month(
+                bill_ym, "manage_energy", data["manage_energy"]
+            )
+        return data
+
+
+class APTiParkingCoordinator(APTiDataUpdateCoordinator):
+    """Visitor parking of the current month.
+
+    The configured interval applies while a visit is active; idle polling
+    backs off up to an hour, within the daily request budget.
+    """
+
+    category = DEVICE_PARKING
+    primary_endpoints = frozenset({"parking_visit"})
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize coordinator."""
+        super().__init__(*args, **kwargs)
+        self.poll_policy = AdaptivePollPolicy(
+            fast=self.update_interval,
+            idle_max=PARKING_IDLE_MAX_INTERVAL,
+            daily_budget=int(
+                self.config_entry.options.get(
+                    CONF_PARKING_DAILY_BUDGET, DEFAULT_PARKING_DAILY_BUDGET
+                )
+            ),
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Refresh and pick the next interval from visit activity."""
+        now = dt_util.now()
+        sent = self._client.requests_sent(PARKING_PATH_PREFIX)
+        active = False
+        try:
+            data = await super()._async_update_data()
+            # Cached so the snapshot property does not parse the same data again.
+            self._snapshot = APTiSnapshot.from_data(data)
+            active = parking_active(self._snapshot, now)
+            return data
+        finally:
+            # Cached endpoints send nothing; retries and background revalidation count.
+            self.poll_policy.record_requests(
+                now, self._client.requests_sent(PARKING_PATH_PREFIX) - sent
+            )
+            self.update_interval = self.poll_policy.next_interval(active, now)
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        based_month = dt_util.now().strftime("%Y%m")
+        raw = await self._async_fetch_all(
+            {
+                "parking_visit": partial(self._client.async_get_parking_visit, based_month),
+                "parking_application_status": (
+                    self._client.async_get_parking_application_status
+                ),
+                "parking_favorites": self._client.async_get_parking_favorites,
+            }
+        )
+        favorites = raw.get("parking_favorites")
+        return {
+            "parking_visit": _dict_or_empty(raw.get("parking_visit")),
+            "parking_application_status": _dict_or_empty(
+                raw.get("parking_application_status")
+            ),
+            "parking_favorites": favorites if isinstance(favorites, list) else [],
+            "based_month": based_month,
+            "fetched_at": dt_util.utcnow().isoformat(),
+        }
+
+
+COORDINATORS: dict[str, type[APTiDataUpdateCoordinator]] = {
+    coordinator.category: coordinator
+    for coordinator in (
+        APTiAccountCoordinator,
+        APTiManagementFeeCoordinator,
+        APTiPaymentCoordinator,
+        APTiEnergyCoordinator,
+        APTiParkingCoordinator,
+    )
+}
+
+
+def coordinator_key(sections: Iterable[str], default: str) -> str:
+    """Return the category whose coordinator owns the first of ``sections``."""
+    for section in sections:
+        root = section.split(".", 1)[0]
+        for category, owned in COORDINATOR_SECTIONS.items():
+            if root in owned:
+                return category
+    return default
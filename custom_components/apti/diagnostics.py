@@ -0,0 +1,57 @@
+"""Diagnostics support for APTi."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .api import APTiClient
+from .const import DOMAIN
+from .coordinator import APTiDataUpdateCoordinator
+from .session import connection_stats
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime = hass.data[DOMAIN][entry.entry_id]
+    client: APTiClient = runtime["client"]
+    coordinators: dict[str, APTiDataUpdateCoordinator] = runtime["coordinators"]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "client": {
+            "logins": client.login_stats,
+            "token_lifetime_seconds": client.token_lifetime,
+            "token_remaining_seconds": client.token_remaining,
+            "conditional_requests": client.conditional_stats,
+            "response_cache": client.response_cache_stats,
+            "limiter": client.limiter_stats,
+            "circuit_breakers": client.breaker_stats,
+            "transfers": client.transfer_stats,
+            "dedicated_session": connection_stats(hass),
+        },
+        "coordinators": {
+            category: {
+                "update_interval_seconds": (
+                    coordinator.update_interval.total_seconds()
+                    if coordinator.update_interval
+                    else None
+                ),
+                "poll_policy": (
+                    coordinator.poll_policy.state if coordinator.poll_policy else None
+                ),
+                "last_update_success": coordinator.last_update_success,
+                "state_writes": coordinator.write_stats.as_dict(),
+                "partial_errors": (coordinator.data or {}).get("partial_errors", {}),
+            }
+            for category, coordinator in coordinators.items()
+        },
+    }
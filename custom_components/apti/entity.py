@@ -2,25 +2,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import datetime
 import re
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, NAME
+from .const import (
+    DEVICE_ACCOUNT,
+    DEVICE_ENERGY,
+    DEVICE_MANAGEMENT_FEE,
+    DEVICE_PARKING,
+    DEVICE_PAYMENT,
+    DEVICE_SYSTEM,
+    DOMAIN,
+    MANUFACTURER,
+    NAME,
+)
 from .coordinator import APTiDataUpdateCoordinator
 
 _RE_NON_WORD = re.compile(r"[^0-9a-zA-Z_]+")
 
-DEVICE_ACCOUNT = "account"
-DEVICE_MANAGEMENT_FEE = "management_fee"
-DEVICE_PARKING = "parking"
-DEVICE_PAYMENT = "payment"
-DEVICE_ENERGY = "energy"
-DEVICE_SYSTEM = "system"
-
 
 @dataclass(frozen=True, slots=True)
 class AptiDeviceDescriptor:
@@ -58,19 +66,69 @@ class AptiCoordinatorEntity(CoordinatorEntity[APTiDataUpdateCoordinator]):
         config_entry: ConfigEntry,
         unique_suffix: str,
         device_key: str,
+        sections: Iterable[str] | None = None,
     ) -> None:
-        """Initialize entity."""
-        super().__init__(coordinator)
+        """Initialize entity.
+
+        ``sections`` lists the data paths the entity reads; it is only woken up
+        when one of them changed, and endpoints are only fetched while an
+        enabled entity reads them. Without it the entity sees every update.
+        """
+        super().__init__(coordinator, context=frozenset(sections) if sections else None)
         self._config_entry = config_entry
         self._device_key = (
             device_key if device_key in DEVICE_DESCRIPTORS else DEVICE_SYSTEM
         )
         self._attr_unique_id = f"{config_entry.entry_id}_{self._device_key}_{unique_suffix}"
+        if sections:
+            coordinator.async_register_reader(self._attr_unique_id, sections)
+        self._last_written: tuple[Any, ...] | None = None
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return what a state write would publish."""
+        return (
+            self.available,
+            self.state,
+            self.unit_of_measurement,
+            self.extra_state_attributes,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state the platform writes when the entity is added."""
+        await super().async_added_to_hass()
+        self._last_written = self._state_fingerprint()
+
+    @callback
+    def _async_write_if_changed(self) -> bool:
+        """Write state only when the published value has changed."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_written:
+            return False
+        self._last_written = fingerprint
+        self.async_write_ha_state()
+        return True
+
+    @callback
+    def _async_start_minute_tick(self) -> None:
+        """Re-evaluate the state every minute, for values extrapolated locally."""
+        self.async_on_remove(
+            async_track_time_change(self.hass, self._async_minute_tick, second=0)
+        )
+
+    @callback
+    def _async_minute_tick(self, _now: datetime) -> None:
+        self._async_write_if_changed()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle coordinator data, skipping writes of unchanged state."""
+        self.coordinator.write_stats.record(written=self._async_write_if_changed())
 
     @property
     def device_info(self) -> DeviceInfo:
         """Expose category-specific devices for readability."""
-        account = self.coordinator.data.get("account", {})
+        coordinators = self.hass.data[DOMAIN][self._config_entry.entry_id]["coordinators"]
+        account = (coordinators[DEVICE_ACCOUNT].data or {}).get("account", {})
         apt_name = str(account.get("aptName") or account.get("apt_name") or NAME).strip()
         dong = str(account.get("dong") or account.get("aptDong") or "").strip()
         ho = str(account.get("ho") or account.get("aptHo") or "").strip()
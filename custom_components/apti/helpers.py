@@ -0,0 +1,66 @@
+"""Value parsing helpers for APTi payloads."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+import re
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+_RE_NON_DIGIT = re.compile(r"\D+")
+
+
+def parse_yyyymmdd(value: str | None) -> date | None:
+    if not value or len(value) != 8 or not value.isdigit():
+        return None
+    try:
+        return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    except ValueError:
+        return None
+
+
+def parse_local_datetime(value: str | None) -> datetime | None:
+    """Parse ``YYYYMMDDHHMM[SS]`` with any punctuation as local time."""
+    digits = _RE_NON_DIGIT.sub("", value or "")
+    if len(digits) < 12:
+        return None
+    try:
+        parsed = datetime(
+            int(digits[:4]),
+            int(digits[4:6]),
+            int(digits[6:8]),
+            int(digits[8:10]),
+            int(digits[10:12]),
+            int(digits[12:14]) if len(digits) >= 14 else 0,
+        )
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=dt_util.get_default_time_zone())
+
+
+def safe_float(value: Any) -> float | None:
+    if value is None:
+        return None
+    normalized = str(value).replace(",", "")
+    try:
+        return float(normalized)
+    except (TypeError, ValueError):
+        return None
+
+
+def safe_int(value: Any) -> int | None:
+    if value is None:
+        return None
+    normalized = str(value).replace(",", "")
+    try:
+        return int(float(normalized))
+    except (TypeError, ValueError):
+        return None
+
+
+def safe_text(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
@@ -0,0 +1,131 @@
+"""Adaptive request concurrency for the APTi client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import time
+from typing import Any
+
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 16
+# Multiplicative decrease on throttling, and on latency this many times the average.
+DECREASE_FACTOR = 0.5
+LATENCY_DECREASE_FACTOR = 0.75
+LATENCY_SPIKE_RATIO = 3.0
+LATENCY_SMOOTHING = 0.2
+
+
+class AIMDLimiter:
+    """Cap requests in flight with additive increase, multiplicative decrease.
+
+    Each success grows the window by ``1 / limit``, roughly one slot per full
+    window of successes. Throttling halves it and a latency spike shrinks it,
+    and a ``Retry-After`` holds every new request until it has passed.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_LIMIT,
+        minimum: int = DEFAULT_MIN_LIMIT,
+        maximum: int = DEFAULT_MAX_LIMIT,
+    ) -> None:
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._blocked_until = 0.0
+        self._latency: float | None = None
+        self.throttled = 0
+        self.latency_decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Return the current concurrency window."""
+        return max(self._minimum, int(self._limit))
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return limiter state for diagnostics."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "throttled": self.throttled,
+            "latency_decreases": self.latency_decreases,
+            "average_latency_seconds": (
+                round(self._latency, 3) if self._latency is not None else None
+            ),
+            "cooldown_seconds": round(max(0.0, self._blocked_until - time.monotonic()), 1),
+        }
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot of the window for the duration of a request."""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._wake()
+
+    def on_success(self, latency: float) -> None:
+        """Grow the window, or shrink it when latency spiked."""
+        average = self._latency
+        self._latency = (
+            latency
+            if average is None
+            else average + LATENCY_SMOOTHING * (latency - average)
+        )
+        if average is not None and latency > average * LATENCY_SPIKE_RATIO:
+            self.latency_decreases += 1
+            self._decrease(LATENCY_DECREASE_FACTOR)
+            return
+        self._limit = min(float(self._maximum), self._limit + 1 / self._limit)
+        self._wake()
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """Halve the window and honour a server requested pause."""
+        self.throttled += 1
+        self._decrease(DECREASE_FACTOR)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def _decrease(self, factor: float) -> None:
+        self._limit = max(float(self._minimum), self._limit * factor)
+
+    async def _acquire(self) -> None:
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Woken and cancelled before resuming: hand the slot to the next waiter.
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+        delay = self._blocked_until - time.monotonic()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._in_flight -= 1
+                self._wake()
+                raise
+
+    def _wake(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
@@ -0,0 +1,279 @@
+"""Normalized view of APTi coordinator data."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+from .helpers import parse_yyyymmdd, safe_float, safe_int, safe_text
+
+AMOUNT_KEYS = frozenset({"amt", "fee", "amount"})
+PAID_STATE_CODE = "001"
+
+# Data paths finer than a top-level section, used to notify only affected entities.
+DISCOUNT_SECTION = "management_fee.discount"
+
+
+def detail_section(item_no: str) -> str:
+    """Return the data path of a management fee detail item."""
+    return f"management_fee.detail.{item_no}"
+
+
+def payment_section(state_code: str) -> str:
+    """Return the data path of a payment history state code."""
+    return f"payment_histories.{state_code}"
+
+
+def _pick_scalar_value(payload: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        if payload.get(key) is not None:
+            return payload.get(key)
+    return None
+
+
+def _normalize_scalar(key: str, value: Any) -> int | float | str | None:
+    """Parse a sub-item value the way sub-item sensors expose it."""
+    if value is None:
+        return None
+    if key in AMOUNT_KEYS:
+        return safe_int(value)
+    int_value = safe_int(value)
+    if int_value is not None:
+        return int_value
+    float_value = safe_float(value)
+    if float_value is not None:
+        return float_value
+    return safe_text(value)
+
+
+@dataclass(frozen=True, slots=True)
+class DetailSubItem:
+    """A row of a management fee detail item's ``list``."""
+
+    values: dict[str, int | float | str | None]
+    unit: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class DetailItem:
+    """A management fee detail item."""
+
+    item_no: str
+    name: str | None
+    fee: int | None
+    usage: float | None
+    increase: float | None
+    unit: str | None
+    sub_items: tuple[DetailSubItem | None, ...]
+
+    @classmethod
+    def from_payload(cls, item_no: str, payload: dict[str, Any]) -> DetailItem:
+        unit = safe_text(payload.get("unit"))
+        rows = payload.get("list", [])
+        sub_items: list[DetailSubItem | None] = []
+        if isinstance(rows, list):
+            for row in rows:
+                if not isinstance(row, dict):
+                    sub_items.append(None)
+                    continue
+                sub_items.append(
+                    DetailSubItem(
+                        values={key: _normalize_scalar(key, value) for key, value in row.items()},
+                        unit=safe_text(row.get("unit")) or unit,
+                    )
+                )
+        return cls(
+            item_no=item_no,
+            name=safe_text(payload.get("itemName")),
+            fee=safe_int(payload.get("fee")),
+            usage=safe_float(payload.get("usage")),
+            increase=safe_float(payload.get("increase")),
+            unit=unit,
+            sub_items=tuple(sub_items),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class VisitRecord:
+    """A visitor car entry of the parking visit payload."""
+
+    car_no: str | None
+    visit_date: str | None
+    in_date: str | None
+    out_date: str | None
+    parked_minutes: int | None
+    discount_minutes: int | None
+    calc_minutes: int | None
+    visit_type: str | None
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> VisitRecord:
+        return cls(
+            car_no=safe_text(payload.get("carNoInformation")),
+            visit_date=safe_text(payload.get("visitDate")),
+            in_date=safe_text(payload.get("carInDate")),
+            out_date=safe_text(payload.get("carOutDate")),
+            parked_minutes=safe_int(
+                _pick_scalar_value(payload, ("parkedTimeLong", "parkedTime"))
+            ),
+            discount_minutes=safe_int(payload.get("discountTime")),
+            calc_minutes=safe_int(payload.get("calcTime")),
+            visit_type=safe_text(payload.get("visitType")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentAggregate:
+    """Totals and latest row of one payment history state code."""
+
+    count: int = 0
+    amount: int = 0
+    state_name: str | None = None
+    latest_bill_month: str | None = None
+    latest_paid_date: date | None = None
+    latest_amount: int | None = None
+
+    @classmethod
+    def from_rows(cls, rows: Any) -> PaymentAggregate:
+        """Aggregate rows in a single pass."""
+        if not isinstance(rows, list):
+            return cls()
+        count = 0
+        amount = 0
+        latest: dict[str, Any] | None = None
+        latest_key: tuple[str, str] | None = None
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            count += 1
+            amount += safe_int(row.get("amt")) or 0
+            key = (str(row.get("payDate", "")), str(row.get("billYm", "")))
+            # Strict comparison keeps the first of equal rows, like max().
+            if latest_key is None or key > latest_key:
+                latest, latest_key = row, key
+        if latest is None:
+            return cls()
+        return cls(
+            count=count,
+            amount=amount,
+            state_name=safe_text(latest.get("stateName")),
+            latest_bill_month=safe_text(latest.get("billYm")),
+            latest_paid_date=parse_yyyymmdd(safe_text(latest.get("payDate"))),
+            latest_amount=safe_int(latest.get("amt")),
+        )
+
+
+@dataclass(slots=True)
+class APTiSnapshot:
+    """Coordinator data parsed once per refresh and indexed for O(1) lookups.
+
+    ``get`` reads the raw sections so description lambdas can keep treating the
+    snapshot like the coordinator data dict.
+    """
+
+    data: dict[str, Any]
+    detail_items: dict[str, DetailItem] = field(default_factory=dict)
+    discounts: dict[tuple[str, str, str | None], int | None] = field(default_factory=dict)
+    visits: tuple[VisitRecord, ...] = ()
+    visits_by_car: dict[str, VisitRecord] = field(default_factory=dict)
+    payments: dict[str, PaymentAggregate] = field(default_factory=dict)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a raw coordinator data section."""
+        return self.data.get(key, default)
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> APTiSnapshot:
+        """Build the normalized snapshot of one refresh."""
+        snapshot = cls(data=data)
+        management_fee = data.get("management_fee", {})
+        if isinstance(management_fee, dict):
+            snapshot._index_detail(management_fee.get("detail", []))
+            snapshot._index_discounts(management_fee.get("discount", {}))
+        parking_visit = data.get("parking_visit", {})
+        if isinstance(parking_visit, dict):
+            snapshot._index_visits(parking_visit.get("carListResDtoList", []))
+        histories = data.get("payment_histories", {})
+        if isinstance(histories, dict):
+            snapshot.payments = {
+                state_code: PaymentAggregate.from_rows(rows)
+                for state_code, rows in histories.items()
+            }
+        return snapshot
+
+    def payment(self, state_code: str) -> PaymentAggregate:
+        """Return the aggregate of a payment state code."""
+        return self.payments.get(state_code) or _EMPTY_PAYMENT
+
+    def _index_detail(self, detail: Any) -> None:
+        if not isinstance(detail, list):
+            return
+        for item in detail:
+            if not isinstance(item, dict):
+                continue
+            item_no = str(item.get("itemNo") or "")
+            # Keep the first item per number, as the linear scan used to.
+            if item_no not in self.detail_items:
+                self.detail_items[item_no] = DetailItem.from_payload(item_no, item)
+
+    def _index_discounts(self, discount: Any) -> None:
+        if not isinstance(discount, dict):
+            return
+        for group, entries in discount.items():
+            if not isinstance(entries, list):
+                continue
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                title = str(entry.get("title"))
+                if (group, title, None) in self.discounts:
+                    continue
+                self.discounts[(group, title, None)] = safe_int(entry.get("amt"))
+                children = entry.get("data", [])
+                if not isinstance(children, list):
+                    continue
+                for child in children:
+                    if isinstance(child, dict):
+                        self.discounts.setdefault(
+                            (group, title, str(child.get("title"))), safe_int(child.get("amt"))
+                        )
+
+    def _index_visits(self, cars: Any) -> None:
+        if not isinstance(cars, list):
+            return
+        self.visits = tuple(
+            VisitRecord.from_payload(car) for car in cars if isinstance(car, dict)
+        )
+        for visit in self.visits:
+            if visit.car_no:
+                self.visits_by_car.setdefault(visit.car_no, visit)
+
+
+_EMPTY_PAYMENT = PaymentAggregate()
+
+
+def _changed_keys(old: dict[Any, Any], new: dict[Any, Any]) -> set[Any]:
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+
+def changed_paths(old: APTiSnapshot, new: APTiSnapshot) -> set[str]:
+    """Return the top-level sections and finer paths whose content differs."""
+    changed = _changed_keys(old.data, new.data)
+    if "management_fee" in changed:
+        changed.update(
+            detail_section(item_no)
+            for item_no in _changed_keys(old.detail_items, new.detail_items)
+        )
+        old_fee = old.data.get("management_fee", {})
+        new_fee = new.data.get("management_fee", {})
+        if not isinstance(old_fee, dict) or not isinstance(new_fee, dict) or (
+            old_fee.get("discount") != new_fee.get("discount")
+        ):
+            changed.add(DISCOUNT_SECTION)
+    if "payment_histories" in changed:
+        changed.update(
+            payment_section(state_code)
+            for state_code in _changed_keys(old.payments, new.payments)
+        )
+    return changed
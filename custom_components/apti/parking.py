@@ -0,0 +1,257 @@
+"""Local parking computations between APTi polls."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from math import ceil
+from typing import Any
+
+import holidays
+from homeassistant.util import dt as dt_util
+
+from .helpers import parse_local_datetime, safe_int, safe_text
+from .models import APTiSnapshot, VisitRecord
+
+# Never extrapolate further than this past the last fetch, e.g. from a restored snapshot.
+MAX_EXTRAPOLATION = timedelta(hours=2)
+
+
+def is_parked(visit: VisitRecord) -> bool:
+    """Return True while a visit has entered and not left."""
+    return bool(visit.in_date) and not visit.out_date
+
+
+def fetched_at(snapshot: APTiSnapshot) -> datetime | None:
+    """Return when the parking data of a snapshot was fetched."""
+    value = safe_text(snapshot.get("fetched_at"))
+    return dt_util.parse_datetime(value) if value else None
+
+
+def elapsed_minutes(snapshot: APTiSnapshot, now: datetime) -> int:
+    """Return whole minutes since the fetch, capped at ``MAX_EXTRAPOLATION``."""
+    fetched = fetched_at(snapshot)
+    if fetched is None or now <= fetched:
+        return 0
+    return int(min(now - fetched, MAX_EXTRAPOLATION).total_seconds() // 60)
+
+
+def visit_parked_minutes(
+    visit: VisitRecord, snapshot: APTiSnapshot, now: datetime
+) -> int | None:
+    """Return a visit's parked minutes, counted up locally while it is parked.
+
+    The server value is advanced by the time since the fetch; without one the
+    count starts from ``carInDate``.
+    """
+    if not is_parked(visit):
+        return visit.parked_minutes
+    elapsed = elapsed_minutes(snapshot, now)
+    if visit.parked_minutes is not None:
+        return visit.parked_minutes + elapsed
+    in_at = parse_local_datetime(visit.in_date)
+    fetched = fetched_at(snapshot)
+    if in_at is None or fetched is None:
+        return None
+    return max(0, int((fetched - in_at).total_seconds() // 60)) + elapsed
+
+
+def parked_minutes(snapshot: APTiSnapshot, now: datetime) -> int | None:
+    """Return the month's parked minutes, advanced by every car still parked."""
+    parked = safe_int(snapshot.get("parking_visit", {}).get("parkedTime"))
+    if parked is None:
+        return None
+    active = sum(1 for visit in snapshot.visits if is_parked(visit))
+    return parked + active * elapsed_minutes(snapshot, now)
+
+
+def remaining_minutes(snapshot: APTiSnapshot, now: datetime) -> int | None:
+    """Return the free minutes left, consumed by every car still parked.
+
+    With fare rules only billable minutes are consumed, as in ``visit_fare``.
+    """
+    remaining = free_allowance(snapshot)
+    if remaining is None:
+        return None
+    rules = _fare_rules(snapshot)
+    fetched = fetched_at(snapshot)
+    if rules is None or fetched is None:
+        active = sum(1 for visit in snapshot.visits if is_parked(visit))
+        return max(0, remaining - active * elapsed_minutes(snapshot, now))
+    end = _extrapolation_end(snapshot, now)
+    consumed = 0
+    for visit in snapshot.visits:
+        if is_parked(visit):
+            consumed += (_billable_minutes(rules, visit, snapshot, end) or 0) - (
+                _billable_minutes(rules, visit, snapshot, fetched) or 0
+            )
+    return max(0, remaining - consumed)
+
+
+def free_allowance(snapshot: APTiSnapshot) -> int | None:
+    """Return the household's free visitor minutes left at the fetch."""
+    return safe_int(snapshot.get("parking_visit", {}).get("remainTime"))
+
+
+@lru_cache(maxsize=4)
+def _public_holidays(year: int) -> frozenset[date]:
+    """Return Korean public holidays."""
+    return frozenset(holidays.country_holidays("KR", years=year))
+
+
+@dataclass(frozen=True, slots=True)
+class FareRules:
+    """Visitor parking fare of a complex.
+
+    Every started ``based_minutes`` block beyond a visit's discount time and
+    the household's free allowance costs ``based_fare``. Minutes on exception
+    days are not charged.
+    """
+
+    based_minutes: int
+    based_fare: int
+    exempt_saturday: bool = False
+    exempt_sunday: bool = False
+    exempt_holiday: bool = False
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> FareRules | None:
+        """Read the rules of the parking visit payload."""
+        based_minutes = safe_int(payload.get("basedMinutes"))
+        based_fare = safe_int(payload.get("basedMinutesFare"))
+        if not based_minutes or based_minutes <= 0 or based_fare is None:
+            return None
+        exceptions = payload.get("exceptions", {})
+        if not isinstance(exceptions, dict):
+            exceptions = {}
+        return cls(
+            based_minutes=based_minutes,
+            based_fare=based_fare,
+            exempt_saturday=_is_yes(exceptions.get("exSatUseYn")),
+            exempt_sunday=_is_yes(exceptions.get("exSunUseYn")),
+            exempt_holiday=_is_yes(exceptions.get("exHolidayUseYn")),
+        )
+
+    def is_exempt(self, day: date) -> bool:
+        """Return True when parking on ``day`` is not charged."""
+        weekday = day.weekday()
+        return (
+            (self.exempt_saturday and weekday == 5)
+            or (self.exempt_sunday and weekday == 6)
+            or (self.exempt_holiday and day in _public_holidays(day.year))
+        )
+
+    def chargeable_minutes(self, start: datetime, end: datetime) -> int:
+        """Return minutes between ``start`` and ``end`` outside exception days."""
+        if end <= start:
+            return 0
+        if not (self.exempt_saturday or self.exempt_sunday or self.exempt_holiday):
+            return int((end - start).total_seconds() // 60)
+        total = timedelta()
+        cursor = start
+        while cursor < end:
+            next_day = dt_util.start_of_local_day(cursor.date() + timedelta(days=1))
+            segment_end = min(next_day, end)
+            if not self.is_exempt(cursor.date()):
+                total += segment_end - cursor
+            cursor = segment_end
+        return int(total.total_seconds() // 60)
+
+    def fare(self, minutes: float) -> int:
+        """Return the fare of ``minutes`` billable minutes."""
+        return ceil(max(0, minutes) / self.based_minutes) * self.based_fare
+
+
+def _is_yes(value: Any) -> bool:
+    return str(value or "").strip().upper() in {"Y", "YES", "TRUE", "1"}
+
+
+def _billable_minutes(
+    rules: FareRules, visit: VisitRecord, snapshot: APTiSnapshot, at: datetime
+) -> int | None:
+    """Return a visit's chargeable minutes by ``at`` beyond its discount time."""
+    in_at = parse_local_datetime(visit.in_date)
+    if in_at is not None:
+        end = parse_local_datetime(visit.out_date) if visit.out_date else None
+        minutes = rules.chargeable_minutes(in_at, end or at)
+    else:
+        minutes = visit_parked_minutes(visit, snapshot, at)
+        if minutes is None:
+            return None
+    return max(0, minutes - (visit.discount_minutes or 0))
+
+
+def visit_fare(
+    rules: FareRules, visit: VisitRecord, snapshot: APTiSnapshot, at: datetime
+) -> int | None:
+    """Return the fare a visit has accrued by ``at``.
+
+    Billable minutes are free while the household allowance lasts. Allowance
+    left at the fetch means every earlier minute was free; later minutes of
+    parked cars draw on an equal share of what was left.
+    """
+    billable = _billable_minutes(rules, visit, snapshot, at)
+    if billable is None:
+        return None
+    allowance = free_allowance(snapshot)
+    fetched = fetched_at(snapshot)
+    if allowance is not None and fetched is not None:
+        before = (
+            billable
+            if at <= fetched
+            else _billable_minutes(rules, visit, snapshot, fetched) or 0
+        )
+        free = before if allowance > 0 else 0
+        if is_parked(visit) and at > fetched:
+            parked = sum(1 for other in snapshot.visits if is_parked(other))
+            free += min(billable - before, allowance / max(parked, 1))
+        billable = max(0, billable - free)
+    return rules.fare(billable)
+
+
+def _fare_rules(snapshot: APTiSnapshot) -> FareRules | None:
+    payload = snapshot.get("parking_visit", {})
+    return FareRules.from_payload(payload) if isinstance(payload, dict) else None
+
+
+def _extrapolation_end(snapshot: APTiSnapshot, now: datetime) -> datetime:
+    fetched = fetched_at(snapshot)
+    return now if fetched is None else min(now, fetched + MAX_EXTRAPOLATION)
+
+
+def visit_expected_fee(
+    visit: VisitRecord, snapshot: APTiSnapshot, now: datetime
+) -> int | None:
+    """Return the fare of one visit as of now."""
+    rules = _fare_rules(snapshot)
+    if rules is None:
+        return None
+    return visit_fare(rules, visit, snapshot, _extrapolation_end(snapshot, now))
+
+
+def expected_fee(snapshot: APTiSnapshot, now: datetime) -> int | None:
+    """Return the expected parking fee, advanced by fares accrued since the fetch.
+
+    The server figure stays authoritative; only the growth of parked visits'
+    fares after the fetch is added locally.
+    """
+    server = safe_int(snapshot.get("parking_visit", {}).get("expectedParkingFee"))
+    rules = _fare_rules(snapshot)
+    fetched = fetched_at(snapshot)
+    if rules is None or fetched is None:
+        return server
+
+    end = _extrapolation_end(snapshot, now)
+    if server is None:
+        fares = (visit_fare(rules, visit, snapshot, end) for visit in snapshot.visits)
+        return sum(fare for fare in fares if fare is not None)
+
+    accrued = 0
+    for visit in snapshot.visits:
+        if not is_parked(visit) or parse_local_datetime(visit.in_date) is None:
+            continue
+        accrued += (visit_fare(rules, visit, snapshot, end) or 0) - (
+            visit_fare(rules, visit, snapshot, fetched) or 0
+        )
+    return server + accrued
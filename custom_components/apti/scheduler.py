@@ -0,0 +1,197 @@
+"""Adaptive refresh scheduling for APTi coordinators."""
+
+from __future__ import annotations
+
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from statistics import median
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .models import APTiSnapshot
+
+# Ceiling of the idle backoff between parking polls.
+PARKING_IDLE_MAX_INTERVAL = timedelta(hours=1)
+
+# Fee polling outside the publish and due date windows.
+BILLING_SPARSE_INTERVAL = timedelta(days=1)
+# Days on either side of the expected publish day and the due date polled densely.
+BILLING_WINDOW_DAYS = 2
+# Publish days remembered to estimate the usual one.
+BILLING_PUBLISH_HISTORY = 6
+
+
+def parking_active(snapshot: APTiSnapshot, now: datetime) -> bool:
+    """Return True while a visitor car is parked or expected today."""
+    today = now.strftime("%Y%m%d")
+    for visit in snapshot.visits:
+        if visit.in_date and not visit.out_date:
+            return True
+        # A reservation for today that has not entered yet.
+        visit_day = "".join(filter(str.isdigit, visit.visit_date or ""))[:8]
+        if not visit.in_date and visit_day == today:
+            return True
+    return False
+
+
+class AdaptivePollPolicy:
+    """Poll at ``fast`` while active and back off exponentially while idle.
+
+    Requests are counted per local day, and no interval is shorter than an
+    even spread of the remaining daily request budget over the rest of the
+    day, at the cost of the last poll.
+    """
+
+    def __init__(self, fast: timedelta, idle_max: timedelta, daily_budget: int) -> None:
+        self._fast = fast
+        self._idle_max = max(idle_max, fast)
+        self._daily_budget = daily_budget
+        self._idle_rounds = 0
+        self._day: str | None = None
+        self._used = 0
+        self._per_poll = 1
+        self._active = False
+        self._interval = fast
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return scheduler state for diagnostics."""
+        return {
+            "active": self._active,
+            "interval_seconds": self._interval.total_seconds(),
+            "idle_rounds": self._idle_rounds,
+            "requests_today": self._used,
+            "requests_per_poll": self._per_poll,
+            "daily_budget": self._daily_budget,
+        }
+
+    def record_requests(self, now: datetime, requests: int) -> None:
+        """Count the requests of one poll against today's budget."""
+        day = now.strftime("%Y%m%d")
+        if day != self._day:
+            self._day = day
+            self._used = 0
+        self._used += requests
+        self._per_poll = max(1, requests)
+
+    def next_interval(self, active: bool, now: datetime) -> timedelta:
+        """Return the delay until the next poll."""
+        self._active = active
+        if active:
+            self._idle_rounds = 0
+            interval = self._fast
+        else:
+            interval = min(self._fast * 2**self._idle_rounds, self._idle_max)
+            if interval < self._idle_max:
+                self._idle_rounds += 1
+
+        until_midnight = dt_util.start_of_local_day(now) + timedelta(days=1) - now
+        polls_left = (self._daily_budget - self._used) // self._per_poll
+        if polls_left <= 0:
+            interval = max(interval, until_midnight)
+        else:
+            interval = max(interval, until_midnight / polls_left)
+
+        self._interval = interval
+        return interval
+
+
+class BillingCyclePolicy:
+    """Poll fee endpoints densely around bill publication and the due date.
+
+    The usual publish day is learned from the days new ``billYm`` values were
+    first seen. Until one is known every poll uses the dense interval.
+    """
+
+    def __init__(
+        self, dense: timedelta, sparse: timedelta, saved: dict[str, Any] | None = None
+    ) -> None:
+        self._dense = dense
+        self._sparse = max(sparse, dense)
+        saved = saved or {}
+        self._bill_ym: str | None = saved.get("bill_ym")
+        self._published_on: str | None = saved.get("published_on")
+        self._publish_days: list[int] = [
+            day for day in saved.get("publish_days", []) if isinstance(day, int)
+        ]
+        self._dense_reason: str | None = None
+        self._interval = dense
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return scheduler state for diagnostics."""
+        return {
+            **self.as_dict(),
+            "expected_publish_day": self.expected_publish_day,
+            "dense_reason": self._dense_reason,
+            "interval_seconds": self._interval.total_seconds(),
+        }
+
+    @property
+    def expected_publish_day(self) -> int | None:
+        """Return the usual day of month a new bill is published."""
+        if not self._publish_days:
+            return None
+        return int(median(self._publish_days))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return what survives a restart."""
+        return {
+            "bill_ym": self._bill_ym,
+            "published_on": self._published_on,
+            "publish_days": self._publish_days,
+        }
+
+    def observe(self, bill_ym: str | None, now: datetime) -> str | None:
+        """Record the current billing month; return the previous one if it just changed."""
+        if not bill_ym or bill_ym == self._bill_ym:
+            return None
+        previous, self._bill_ym = self._bill_ym, bill_ym
+        if previous is None or bill_ym < previous:
+            return None
+        self._published_on = now.date().isoformat()
+        self._publish_days = [*self._publish_days, now.day][-BILLING_PUBLISH_HISTORY:]
+        return previous
+
+    def next_interval(self, now: datetime, due_date: date | None) -> timedelta:
+        """Return the delay until the next poll."""
+        if self.expected_publish_day is None:
+            self._dense_reason = "learning"
+            self._interval = self._dense
+            return self._dense
+
+        windows: list[tuple[str, date]] = [
+            ("publish", day)
+            for day in self._publish_candidates(now.date(), self.expected_publish_day)
+        ]
+        if due_date is not None:
+            windows.append(("due_date", due_date))
+
+        self._dense_reason = None
+        interval = self._sparse
+        for reason, center in windows:
+            start = dt_util.start_of_local_day(center - timedelta(days=BILLING_WINDOW_DAYS))
+            end = dt_util.start_of_local_day(center + timedelta(days=BILLING_WINDOW_DAYS + 1))
+            if start <= now < end:
+                self._dense_reason = reason
+                interval = self._dense
+                break
+            if now < start:
+                interval = min(interval, max(start - now, self._dense))
+
+        self._interval = interval
+        return interval
+
+    def _publish_candidates(self, today: date, day: int) -> list[date]:
+        """Return expected publish dates this month and next, minus a done one."""
+        published_on = date.fromisoformat(self._published_on) if self._published_on else None
+        candidates: list[date] = []
+        year, month = today.year, today.month
+        for _ in range(2):
+            candidate = date(year, month, min(day, monthrange(year, month)[1]))
+            # This cycle's bill already appeared.
+            if published_on is None or abs((candidate - published_on).days) > 15:
+                candidates.append(candidate)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return candidates
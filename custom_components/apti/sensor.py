@@ -9,17 +9,19 @@ from typing import Any, Callable
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    CONF_SCAN_INTERVAL,
     PERCENTAGE,
     UnitOfArea,
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_SCAN_INTERVAL_MINUTES, DOMAIN, PAYMENT_STATE_CODES
-from .coordinator import APTiDataUpdateCoordinator
+from .backfill import APTiBillBackfill
+from .const import DOMAIN, PAYMENT_STATE_CODES
+from .coordinator import APTiDataUpdateCoordinator, coordinator_key
 from .entity import (
+    DEVICE_DESCRIPTORS,
     AptiCoordinatorEntity,
     DEVICE_ACCOUNT,
     DEVICE_ENERGY,
@@ -29,61 +31,28 @@ from .entity import (
     DEVICE_SYSTEM,
     slugify,
 )
+from .helpers import parse_yyyymmdd, safe_float, safe_int, safe_text
+from .models import (
+    AMOUNT_KEYS,
+    DISCOUNT_SECTION,
+    PAID_STATE_CODE,
+    APTiSnapshot,
+    DetailItem,
+    DetailSubItem,
+    VisitRecord,
+    detail_section,
+    payment_section,
+)
+from .parking import (
+    expected_fee,
+    parked_minutes,
+    remaining_minutes,
+    visit_expected_fee,
+    visit_parked_minutes,
+)
 
 CURRENCY_KRW = "KRW"
-
-
-def _parse_yyyymmdd(value: str | None) -> date | None:
-    if not value or len(value) != 8 or not value.isdigit():
-        return None
-    try:
-        return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
-    except ValueError:
-        return None
-
-
-def _safe_float(value: Any) -> float | None:
-    if value is None:
-        return None
-    normalized = str(value).replace(",", "")
-    try:
-        return float(normalized)
-    except (TypeError, ValueError):
-        return None
-
-
-def _safe_int(value: Any) -> int | None:
-    if value is None:
-        return None
-    normalized = str(value).replace(",", "")
-    try:
-        return int(float(normalized))
-    except (TypeError, ValueError):
-        return None
-
-
-def _safe_text(value: Any) -> str | None:
-    if value is None:
-        return None
-    text = str(value).strip()
-    return text or None
-
-
-def _get_latest_payment_row(data: dict[str, Any]) -> dict[str, Any] | None:
-    histories = data.get("payment_histories", {})
-    rows = histories.get("001", []) if isinstance(histories, dict) else []
-    if not isinstance(rows, list) or not rows:
-        return None
-    candidates = [row for row in rows if isinstance(row, dict)]
-    if not candidates:
-        return None
-    return max(
-        candidates,
-        key=lambda row: (
-            str(row.get("payDate", "")),
-            str(row.get("billYm", "")),
-        ),
-    )
+PAYMENT_PAID_SECTION = payment_section(PAID_STATE_CODE)
 
 
 def _management_detail_rows(data: dict[str, Any]) -> list[dict[str, Any]]:
@@ -93,20 +62,6 @@ def _management_detail_rows(data: dict[str, Any]) -> list[dict[str, Any]]:
     return [item for item in detail if isinstance(item, dict)]
 
 
-def _find_management_detail_item(data: dict[str, Any], item_no: str) -> dict[str, Any] | None:
-    for item in _management_detail_rows(data):
-        if str(item.get("itemNo") or "") == item_no:
-            return item
-    return None
-
-
-def _parking_visit_rows(data: dict[str, Any]) -> list[dict[str, Any]]:
-    cars = data.get("parking_visit", {}).get("carListResDtoList", [])
-    if not isinstance(cars, list):
-        return []
-    return [car for car in cars if isinstance(car, dict)]
-
-
 def _pick_dynamic_value_key(payload: dict[str, Any], preferred: tuple[str, ...]) -> str | None:
     for key in preferred:
         if payload.get(key) is not None:
@@ -120,24 +75,20 @@ def _pick_dynamic_value_key(payload: dict[str, Any], preferred: tuple[str, ...])
     return None
 
 
-def _pick_scalar_value(payload: dict[str, Any], keys: tuple[str, ...]) -> Any:
-    for key in keys:
-        if payload.get(key) is not None:
-            return payload.get(key)
-    return None
-
-
 @dataclass(slots=True)
 class AptiSensorDescription:
     """Definition for simple static sensors."""
 
     key: str
     name: str
-    value_fn: Callable[[dict[str, Any]], Any]
+    value_fn: Callable[[APTiSnapshot], Any]
     native_unit_of_measurement: str | None = None
     device_class: SensorDeviceClass | None = None
     icon: str | None = None
     device_key: str = DEVICE_SYSTEM
+    sections: tuple[str, ...] = ()
+    # Recompute every minute because the value is extrapolated from the clock.
+    ticks: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -146,62 +97,62 @@ class AptiParkingVisitFieldDescription:
 
     key: str
     name: str
-    source_keys: tuple[str, ...]
     icon: str | None = None
     native_unit_of_measurement: str | None = None
     device_class: SensorDeviceClass | None = None
+    ticks: bool = False
 
 
 PARKING_VISIT_FIELDS: tuple[AptiParkingVisitFieldDescription, ...] = (
     AptiParkingVisitFieldDescription(
         key="car_no",
         name="차량번호",
-        source_keys=("carNoInformation",),
         icon="mdi:car-info",
     ),
     AptiParkingVisitFieldDescription(
         key="visit_date",
         name="방문일",
-        source_keys=("visitDate",),
         icon="mdi:calendar",
     ),
     AptiParkingVisitFieldDescription(
         key="in_date",
         name="입차일시",
-        source_keys=("carInDate",),
         icon="mdi:car-arrow-right",
     ),
     AptiParkingVisitFieldDescription(
         key="out_date",
         name="출차일시",
-        source_keys=("carOutDate",),
         icon="mdi:car-arrow-left",
     ),
     AptiParkingVisitFieldDescription(
         key="parked_minutes",
         name="주차시간",
-        source_keys=("parkedTimeLong", "parkedTime"),
         icon="mdi:car-clock",
         native_unit_of_measurement=UnitOfTime.MINUTES,
+        ticks=True,
     ),
     AptiParkingVisitFieldDescription(
         key="discount_minutes",
         name="할인시간",
-        source_keys=("discountTime",),
         icon="mdi:ticket-percent",
         native_unit_of_measurement=UnitOfTime.MINUTES,
     ),
     AptiParkingVisitFieldDescription(
         key="calc_minutes",
         name="정산시간",
-        source_keys=("calcTime",),
         icon="mdi:calculator-variant-outline",
         native_unit_of_measurement=UnitOfTime.MINUTES,
     ),
+    AptiParkingVisitFieldDescription(
+        key="expected_fee",
+        name="예상요금",
+        native_unit_of_measurement=CURRENCY_KRW,
+        device_class=SensorDeviceClass.MONETARY,
+        ticks=True,
+    ),
     AptiParkingVisitFieldDescription(
         key="visit_type",
         name="방문유형",
-        source_keys=("visitType",),
         icon="mdi:card-account-details-outline",
     ),
 )
@@ -213,14 +164,16 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         name="회원 ID",
         icon="mdi:account",
         device_key=DEVICE_ACCOUNT,
-        value_fn=lambda d: _safe_text(d.get("account", {}).get("userId")),
+        sections=("account",),
+        value_fn=lambda d: safe_text(d.get("account", {}).get("userId")),
     ),
     AptiSensorDescription(
         key="account_apt_code",
         name="단지 코드",
         icon="mdi:identifier",
         device_key=DEVICE_ACCOUNT,
-        value_fn=lambda d: _safe_text(d.get("account", {}).get("code")),
+        sections=("account",),
+        value_fn=lambda d: safe_text(d.get("account", {}).get("code")),
     ),
     AptiSensorDescription(
         key="mgmt_month_fee",
@@ -228,7 +181,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _safe_int(d.get("manage_home", {}).get("monthFee")),
+        sections=("manage_home",),
+        value_fn=lambda d: safe_int(d.get("manage_home", {}).get("monthFee")),
     ),
     AptiSensorDescription(
         key="mgmt_previous_month_fee",
@@ -236,7 +190,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _safe_int(d.get("manage_home", {}).get("bfMonthFee")),
+        sections=("manage_home",),
+        value_fn=lambda d: safe_int(d.get("manage_home", {}).get("bfMonthFee")),
     ),
     AptiSensorDescription(
         key="mgmt_due_fee",
@@ -244,7 +199,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _safe_int(d.get("manage_home", {}).get("bfDueFee")),
+        sections=("manage_home",),
+        value_fn=lambda d: safe_int(d.get("manage_home", {}).get("bfDueFee")),
     ),
     AptiSensorDescription(
         key="mgmt_discount_total",
@@ -252,7 +208,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _safe_int(
+        sections=("management_fee",),
+        value_fn=lambda d: safe_int(
             d.get("management_fee", {}).get("discount", {}).get("discountFee")
         ),
     ),
@@ -261,14 +218,16 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         name="청구월",
         icon="mdi:calendar-month",
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _safe_text(d.get("manage_home", {}).get("billYm")),
+        sections=("manage_home",),
+        value_fn=lambda d: safe_text(d.get("manage_home", {}).get("billYm")),
     ),
     AptiSensorDescription(
         key="mgmt_due_date",
         name="관리비 마감일",
         device_class=SensorDeviceClass.DATE,
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _parse_yyyymmdd(
+        sections=("manage_home",),
+        value_fn=lambda d: parse_yyyymmdd(
             (
                 d.get("manage_home", {})
                 .get("paymentInformation", [{}])[0]
@@ -283,7 +242,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         name="전용면적",
         native_unit_of_measurement=UnitOfArea.SQUARE_METERS,
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _safe_float(d.get("manage_home", {}).get("area")),
+        sections=("manage_home",),
+        value_fn=lambda d: safe_float(d.get("manage_home", {}).get("area")),
     ),
     AptiSensorDescription(
         key="energy_my_fee",
@@ -291,7 +251,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_ENERGY,
-        value_fn=lambda d: _safe_int(
+        sections=("manage_home",),
+        value_fn=lambda d: safe_int(
             d.get("manage_home", {}).get("energyCondition", {}).get("myFee")
         ),
     ),
@@ -301,7 +262,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_ENERGY,
-        value_fn=lambda d: _safe_int(
+        sections=("manage_home",),
+        value_fn=lambda d: safe_int(
             d.get("manage_home", {}).get("energyCondition", {}).get("avgFee")
         ),
     ),
@@ -310,7 +272,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         name="평균 대비 에너지 사용",
         native_unit_of_measurement=PERCENTAGE,
         device_key=DEVICE_ENERGY,
-        value_fn=lambda d: _safe_int(
+        sections=("manage_home",),
+        value_fn=lambda d: safe_int(
             d.get("manage_home", {}).get("energyCondition", {}).get("compAvg")
         ),
     ),
@@ -320,7 +283,9 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.MINUTES,
         icon="mdi:car-clock",
         device_key=DEVICE_PARKING,
-        value_fn=lambda d: _safe_int(d.get("parking_visit", {}).get("parkedTime")),
+        sections=("parking_visit", "fetched_at"),
+        value_fn=lambda d: parked_minutes(d, dt_util.now()),
+        ticks=True,
     ),
     AptiSensorDescription(
         key="parking_remaining_minutes",
@@ -328,7 +293,9 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.MINUTES,
         icon="mdi:timer-sand",
         device_key=DEVICE_PARKING,
-        value_fn=lambda d: _safe_int(d.get("parking_visit", {}).get("remainTime")),
+        sections=("parking_visit", "fetched_at"),
+        value_fn=lambda d: remaining_minutes(d, dt_util.now()),
+        ticks=True,
     ),
     AptiSensorDescription(
         key="parking_expected_fee",
@@ -336,7 +303,9 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_PARKING,
-        value_fn=lambda d: _safe_int(d.get("parking_visit", {}).get("expectedParkingFee")),
+        sections=("parking_visit", "fetched_at"),
+        value_fn=lambda d: expected_fee(d, dt_util.now()),
+        ticks=True,
     ),
     AptiSensorDescription(
         key="parking_based_minutes",
@@ -344,7 +313,8 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.MINUTES,
         icon="mdi:clock-outline",
         device_key=DEVICE_PARKING,
-        value_fn=lambda d: _safe_int(d.get("parking_visit", {}).get("basedMinutes")),
+        sections=("parking_visit",),
+        value_fn=lambda d: safe_int(d.get("parking_visit", {}).get("basedMinutes")),
     ),
     AptiSensorDescription(
         key="parking_based_minutes_fare",
@@ -352,28 +322,32 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_PARKING,
-        value_fn=lambda d: _safe_int(d.get("parking_visit", {}).get("basedMinutesFare")),
+        sections=("parking_visit",),
+        value_fn=lambda d: safe_int(d.get("parking_visit", {}).get("basedMinutesFare")),
     ),
     AptiSensorDescription(
         key="parking_visit_vehicle_count",
         name="방문차량 건수",
         icon="mdi:car-multiple",
         device_key=DEVICE_PARKING,
-        value_fn=lambda d: len(_parking_visit_rows(d)),
+        sections=("parking_visit",),
+        value_fn=lambda d: len(d.visits),
     ),
     AptiSensorDescription(
         key="payment_history_latest_bill_month",
         name="최근 납부월",
         icon="mdi:calendar-check",
         device_key=DEVICE_PAYMENT,
-        value_fn=lambda d: _safe_text((_get_latest_payment_row(d) or {}).get("billYm")),
+        sections=(PAYMENT_PAID_SECTION,),
+        value_fn=lambda d: d.payment(PAID_STATE_CODE).latest_bill_month,
     ),
     AptiSensorDescription(
         key="payment_history_latest_paid_date",
         name="최근 납부일",
         device_class=SensorDeviceClass.DATE,
         device_key=DEVICE_PAYMENT,
-        value_fn=lambda d: _parse_yyyymmdd((_get_latest_payment_row(d) or {}).get("payDate")),
+        sections=(PAYMENT_PAID_SECTION,),
+        value_fn=lambda d: d.payment(PAID_STATE_CODE).latest_paid_date,
     ),
     AptiSensorDescription(
         key="payment_history_latest_paid_amount",
@@ -381,14 +355,16 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_PAYMENT,
-        value_fn=lambda d: _safe_int((_get_latest_payment_row(d) or {}).get("amt")),
+        sections=(PAYMENT_PAID_SECTION,),
+        value_fn=lambda d: d.payment(PAID_STATE_CODE).latest_amount,
     ),
     AptiSensorDescription(
         key="payment_next_bill_month",
         name="다음 청구월",
         icon="mdi:calendar-arrow-right",
         device_key=DEVICE_PAYMENT,
-        value_fn=lambda d: _safe_text(d.get("manage_payment_next", {}).get("nextBillYm")),
+        sections=("manage_payment_next",),
+        value_fn=lambda d: safe_text(d.get("manage_payment_next", {}).get("nextBillYm")),
     ),
     AptiSensorDescription(
         key="payment_my_cash",
@@ -396,36 +372,32 @@ STATIC_SENSORS: tuple[AptiSensorDescription, ...] = (
         native_unit_of_measurement=CURRENCY_KRW,
         device_class=SensorDeviceClass.MONETARY,
         device_key=DEVICE_PAYMENT,
-        value_fn=lambda d: _safe_int(d.get("manage_payment_next", {}).get("myCash")),
+        sections=("manage_payment_next",),
+        value_fn=lambda d: safe_int(d.get("manage_payment_next", {}).get("myCash")),
     ),
     AptiSensorDescription(
         key="payment_coupon_count",
         name="보유 쿠폰수",
         icon="mdi:ticket-percent",
         device_key=DEVICE_PAYMENT,
-        value_fn=lambda d: _safe_int(d.get("manage_payment_next", {}).get("couponCnt")),
+        sections=("manage_payment_next",),
+        value_fn=lambda d: safe_int(d.get("manage_payment_next", {}).get("couponCnt")),
     ),
     AptiSensorDescription(
         key="autodiscount_honey",
         name="꿀단지 할인 사용",
         icon="mdi:honey-outline",
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _safe_text(d.get("manage_auto_discount", {}).get("honeyYn")),
+        sections=("manage_auto_discount",),
+        value_fn=lambda d: safe_text(d.get("manage_auto_discount", {}).get("honeyYn")),
     ),
     AptiSensorDescription(
         key="autodiscount_schedule_month",
         name="자동할인 예정월",
         icon="mdi:calendar-star",
         device_key=DEVICE_MANAGEMENT_FEE,
-        value_fn=lambda d: _safe_text(d.get("manage_auto_discount", {}).get("schBillYm")),
-    ),
-    AptiSensorDescription(
-        key="refresh_interval_minutes",
-        name="갱신 주기",
-        native_unit_of_measurement=UnitOfTime.MINUTES,
-        icon="mdi:update",
-        device_key=DEVICE_SYSTEM,
-        value_fn=lambda d: _safe_int(d.get("_scan_interval")),
+        sections=("manage_auto_discount",),
+        value_fn=lambda d: safe_text(d.get("manage_auto_discount", {}).get("schBillYm")),
     ),
 )
 
@@ -444,20 +416,48 @@ class AptiStaticSensor(AptiCoordinatorEntity, SensorEntity):
             config_entry,
             f"sensor_{description.key}",
             device_key=description.device_key,
+            sections=description.sections,
         )
-        self.entity_description = description
+        self._description = description
         self._attr_name = description.name
         self._attr_icon = description.icon
         self._attr_native_unit_of_measurement = description.native_unit_of_measurement
         self._attr_device_class = description.device_class
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._description.ticks:
+            self._async_start_minute_tick()
+
     @property
     def native_value(self) -> Any:
-        data = dict(self.coordinator.data)
-        data["_scan_interval"] = self._config_entry.options.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL_MINUTES
-        )
-        return self.entity_description.value_fn(data)
+        return self._description.value_fn(self.coordinator.snapshot)
+
+
+class AptiRefreshIntervalSensor(AptiCoordinatorEntity, SensorEntity):
+    """Current polling interval of one category's coordinator."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_icon = "mdi:update"
+
+    def __init__(
+        self,
+        coordinator: APTiDataUpdateCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        # The fee coordinator's sensor keeps the id of the single one it replaced.
+        unique_suffix = "sensor_refresh_interval_minutes"
+        if coordinator.category != DEVICE_MANAGEMENT_FEE:
+            unique_suffix = f"{unique_suffix}_{coordinator.category}"
+        super().__init__(coordinator, config_entry, unique_suffix, device_key=DEVICE_SYSTEM)
+        self._attr_name = f"{DEVICE_DESCRIPTORS[coordinator.category].name} 갱신 주기"
+
+    @property
+    def native_value(self) -> int | None:
+        interval = self.coordinator.update_interval
+        if interval is None:
+            return None
+        return int(interval.total_seconds() // 60)
 
 
 class AptiManagementDetailFeeSensor(AptiCoordinatorEntity, SensorEntity):
@@ -479,18 +479,16 @@ class AptiManagementDetailFeeSensor(AptiCoordinatorEntity, SensorEntity):
             config_entry,
             f"detail_fee_{item_no}_{slugify(item_name)}",
             device_key=DEVICE_MANAGEMENT_FEE,
+            sections=(detail_section(item_no),),
         )
         self._item_no = item_no
         self._item_name = item_name
         self._attr_name = f"관리비 {item_name}"
 
-    def _get_item(self) -> dict[str, Any] | None:
-        return _find_management_detail_item(self.coordinator.data, self._item_no)
-
     @property
     def native_value(self) -> int | None:
-        item = self._get_item()
-        return _safe_int(item.get("fee")) if item else None
+        item = self.coordinator.snapshot.detail_items.get(self._item_no)
+        return item.fee if item else None
 
 
 class AptiManagementDetailMetaSensor(AptiCoordinatorEntity, SensorEntity):
@@ -509,6 +507,7 @@ class AptiManagementDetailMetaSensor(AptiCoordinatorEntity, SensorEntity):
             config_entry,
             f"detail_meta_{item_no}_{slugify(item_name)}_{metric}",
             device_key=DEVICE_MANAGEMENT_FEE,
+            sections=(detail_section(item_no),),
         )
         self._item_no = item_no
         self._metric = metric
@@ -526,15 +525,15 @@ class AptiManagementDetailMetaSensor(AptiCoordinatorEntity, SensorEntity):
             self._attr_name = f"{item_name} 단위"
             self._attr_icon = "mdi:ruler"
 
-    def _item(self) -> dict[str, Any] | None:
-        return _find_management_detail_item(self.coordinator.data, self._item_no)
+    def _item(self) -> DetailItem | None:
+        return self.coordinator.snapshot.detail_items.get(self._item_no)
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         if self._metric != "usage":
             return None
         item = self._item()
-        return _safe_text(item.get("unit")) if item else None
+        return item.unit if item else None
 
     @property
     def native_value(self) -> int | float | str | None:
@@ -543,12 +542,12 @@ class AptiManagementDetailMetaSensor(AptiCoordinatorEntity, SensorEntity):
             return None
 
         if self._metric == "item_no":
-            return _safe_text(item.get("itemNo"))
+            return item.item_no or None
         if self._metric == "usage":
-            return _safe_float(item.get("usage"))
+            return item.usage
         if self._metric == "increase":
-            return _safe_float(item.get("increase"))
-        return _safe_text(item.get("unit"))
+            return item.increase
+        return item.unit
 
 
 class AptiManagementDetailSubItemSensor(AptiCoordinatorEntity, SensorEntity):
@@ -572,6 +571,7 @@ class AptiManagementDetailSubItemSensor(AptiCoordinatorEntity, SensorEntity):
                 f"{sub_index}_{slugify(sub_title)}_{slugify(value_key)}"
             ),
             device_key=DEVICE_MANAGEMENT_FEE,
+            sections=(detail_section(item_no),),
         )
         self._item_no = item_no
         self._sub_index = sub_index
@@ -580,68 +580,36 @@ class AptiManagementDetailSubItemSensor(AptiCoordinatorEntity, SensorEntity):
         self._attr_name = f"{item_name} {sub_title}"
         self._attr_icon = "mdi:cash-plus"
 
-        if value_key in {"amt", "fee", "amount"}:
+        if value_key in AMOUNT_KEYS:
             self._attr_device_class = SensorDeviceClass.MONETARY
             self._attr_native_unit_of_measurement = CURRENCY_KRW
         elif value_key.endswith("Time") or value_key.endswith("Minutes"):
             self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
 
-    def _sub_item(self) -> tuple[dict[str, Any], dict[str, Any]] | None:
-        parent = _find_management_detail_item(self.coordinator.data, self._item_no)
+    def _sub_item(self) -> DetailSubItem | None:
+        parent = self.coordinator.snapshot.detail_items.get(self._item_no)
         if not parent:
             return None
 
-        rows = parent.get("list", [])
-        if not isinstance(rows, list):
-            return None
-
         index = self._sub_index - 1
-        if index < 0 or index >= len(rows):
-            return None
-
-        row = rows[index]
-        if not isinstance(row, dict):
+        if index < 0 or index >= len(parent.sub_items):
             return None
-        return parent, row
+        return parent.sub_items[index]
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         if self._value_key != "usage":
             return self._attr_native_unit_of_measurement
 
-        data = self._sub_item()
-        if not data:
-            return None
-        parent, row = data
-
-        unit = _safe_text(row.get("unit"))
-        if unit:
-            return unit
-        return _safe_text(parent.get("unit"))
+        sub_item = self._sub_item()
+        return sub_item.unit if sub_item else None
 
     @property
     def native_value(self) -> int | float | str | None:
-        data = self._sub_item()
-        if not data:
+        sub_item = self._sub_item()
+        if not sub_item:
             return None
-
-        _, row = data
-        value = row.get(self._value_key)
-        if value is None:
-            return None
-
-        if self._value_key in {"amt", "fee", "amount"}:
-            return _safe_int(value)
-
-        int_value = _safe_int(value)
-        if int_value is not None:
-            return int_value
-
-        float_value = _safe_float(value)
-        if float_value is not None:
-            return float_value
-
-        return _safe_text(value)
+        return sub_item.values.get(self._value_key)
 
 
 class AptiDiscountSensor(AptiCoordinatorEntity, SensorEntity):
@@ -667,6 +635,7 @@ class AptiDiscountSensor(AptiCoordinatorEntity, SensorEntity):
             config_entry,
             unique,
             device_key=DEVICE_MANAGEMENT_FEE,
+            sections=(DISCOUNT_SECTION,),
         )
         self._group = discount_group
         self._title = title
@@ -677,37 +646,11 @@ class AptiDiscountSensor(AptiCoordinatorEntity, SensorEntity):
         else:
             self._attr_name = f"할인 {title}"
 
-    def _find_amount(self) -> int | None:
-        discount = self.coordinator.data.get("management_fee", {}).get("discount", {})
-        if not isinstance(discount, dict):
-            return None
-
-        entries = discount.get(self._group, [])
-        if not isinstance(entries, list):
-            return None
-
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            if str(entry.get("title")) != self._title:
-                continue
-            if not self._sub_title:
-                return _safe_int(entry.get("amt"))
-
-            children = entry.get("data", [])
-            if not isinstance(children, list):
-                return None
-            for child in children:
-                if not isinstance(child, dict):
-                    continue
-                if str(child.get("title")) == self._sub_title:
-                    return _safe_int(child.get("amt"))
-            return None
-        return None
-
     @property
     def native_value(self) -> int | None:
-        return self._find_amount()
+        return self.coordinator.snapshot.discounts.get(
+            (self._group, self._title, self._sub_title or None)
+        )
 
 
 class AptiPaymentStateSensor(AptiCoordinatorEntity, SensorEntity):
@@ -725,6 +668,7 @@ class AptiPaymentStateSensor(AptiCoordinatorEntity, SensorEntity):
             config_entry,
             f"payment_state_{state_code}_{metric}",
             device_key=DEVICE_PAYMENT,
+            sections=(payment_section(state_code),),
         )
         self._state_code = state_code
         self._metric = metric
@@ -748,42 +692,19 @@ class AptiPaymentStateSensor(AptiCoordinatorEntity, SensorEntity):
             self._attr_icon = "mdi:calendar-check"
             self._attr_device_class = SensorDeviceClass.DATE
 
-    def _rows(self) -> list[dict[str, Any]]:
-        rows = self.coordinator.data.get("payment_histories", {}).get(self._state_code, [])
-        if not isinstance(rows, list):
-            return []
-        return [row for row in rows if isinstance(row, dict)]
-
-    def _latest(self) -> dict[str, Any] | None:
-        rows = self._rows()
-        if not rows:
-            return None
-        return max(
-            rows,
-            key=lambda row: (
-                str(row.get("payDate", "")),
-                str(row.get("billYm", "")),
-            ),
-        )
-
     @property
     def native_value(self) -> int | str | date | None:
-        rows = self._rows()
+        payment = self.coordinator.snapshot.payment(self._state_code)
 
         if self._metric == "count":
-            return len(rows)
+            return payment.count
         if self._metric == "amount":
-            return sum(_safe_int(row.get("amt")) or 0 for row in rows)
-
-        latest = self._latest()
-        if not latest:
-            return None
-
+            return payment.amount
         if self._metric == "state_name":
-            return _safe_text(latest.get("stateName"))
+            return payment.state_name
         if self._metric == "latest_bill_month":
-            return _safe_text(latest.get("billYm"))
-        return _parse_yyyymmdd(_safe_text(latest.get("payDate")))
+            return payment.latest_bill_month
+        return payment.latest_paid_date
 
 
 class AptiParkingVisitDetailSensor(AptiCoordinatorEntity, SensorEntity):
@@ -802,6 +723,7 @@ class AptiParkingVisitDetailSensor(AptiCoordinatorEntity, SensorEntity):
             config_entry,
             f"parking_visit_{visit_index}_{slugify(visit_key)}_{field.key}",
             device_key=DEVICE_PARKING,
+            sections=("parking_visit", "fetched_at") if field.ticks else ("parking_visit",),
         )
         self._visit_index = visit_index
         self._field = field
@@ -811,30 +733,32 @@ class AptiParkingVisitDetailSensor(AptiCoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = field.native_unit_of_measurement
         self._attr_device_class = field.device_class
 
-    def _visit(self) -> dict[str, Any] | None:
-        rows = _parking_visit_rows(self.coordinator.data)
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._field.ticks:
+            self._async_start_minute_tick()
+
+    def _visit(self) -> VisitRecord | None:
+        visits = self.coordinator.snapshot.visits
         index = self._visit_index - 1
-        if index < 0 or index >= len(rows):
+        if index < 0 or index >= len(visits):
             return None
-        return rows[index]
+        return visits[index]
 
     @property
     def native_value(self) -> int | str | date | None:
-        row = self._visit()
-        if not row:
-            return None
-
-        value = _pick_scalar_value(row, self._field.source_keys)
-        if value is None:
+        visit = self._visit()
+        if not visit:
             return None
 
+        if self._field.key == "parked_minutes":
+            return visit_parked_minutes(visit, self.coordinator.snapshot, dt_util.now())
+        if self._field.key == "expected_fee":
+            return visit_expected_fee(visit, self.coordinator.snapshot, dt_util.now())
+        value = getattr(visit, self._field.key)
         if self._field.device_class == SensorDeviceClass.DATE:
-            return _parse_yyyymmdd(_safe_text(value))
-
-        if self._field.native_unit_of_measurement == UnitOfTime.MINUTES:
-            return _safe_int(value)
-
-        return _safe_text(value)
+            return parse_yyyymmdd(value)
+        return value
 
 
 class AptiEnergySensor(AptiCoordinatorEntity, SensorEntity):
@@ -852,6 +776,7 @@ class AptiEnergySensor(AptiCoordinatorEntity, SensorEntity):
             config_entry,
             f"energy_{energy_key}_{metric}",
             device_key=DEVICE_ENERGY,
+            sections=("manage_energy",),
         )
         self._energy_key = energy_key
         self._metric = metric
@@ -886,7 +811,7 @@ class AptiEnergySensor(AptiCoordinatorEntity, SensorEntity):
         item = self._energy_obj()
         if not item:
             return None
-        return _safe_text(item.get("unit"))
+        return safe_text(item.get("unit"))
 
     @property
     def native_value(self) -> int | float | None:
@@ -895,8 +820,42 @@ class AptiEnergySensor(AptiCoordinatorEntity, SensorEntity):
             return None
         value = item.get(self._metric)
         if self._metric == "fee":
-            return _safe_int(value)
-        return _safe_float(value)
+            return safe_int(value)
+        return safe_float(value)
+
+
+class AptiBackfillProgressSensor(AptiCoordinatorEntity, SensorEntity):
+    """Progress of the historical bill backfill."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_icon = "mdi:database-clock"
+
+    def __init__(
+        self,
+        coordinator: APTiDataUpdateCoordinator,
+        config_entry: ConfigEntry,
+        backfill: APTiBillBackfill,
+    ) -> None:
+        super().__init__(
+            coordinator,
+            config_entry,
+            "backfill_progress",
+            device_key=DEVICE_SYSTEM,
+        )
+        self._backfill = backfill
+        self._attr_name = "과거 관리비 수집"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._backfill.async_add_listener(self._async_write_if_changed))
+
+    @property
+    def native_value(self) -> int:
+        return self._backfill.progress
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self._backfill.state
 
 
 async def async_setup_entry(
@@ -905,43 +864,63 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up APTi sensors."""
-    coordinator: APTiDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    runtime = hass.data[DOMAIN][config_entry.entry_id]
+    coordinators: dict[str, APTiDataUpdateCoordinator] = runtime["coordinators"]
+    fee_coordinator = coordinators[DEVICE_MANAGEMENT_FEE]
+    # Optional categories are missing when their fetching is disabled in options.
+    payment_coordinator = coordinators.get(DEVICE_PAYMENT)
+    energy_coordinator = coordinators.get(DEVICE_ENERGY)
+    parking_coordinator = coordinators.get(DEVICE_PARKING)
     entities: list[SensorEntity] = []
 
+    entities.append(
+        AptiBackfillProgressSensor(fee_coordinator, config_entry, runtime["backfill"])
+    )
     entities.extend(
-        AptiStaticSensor(coordinator, config_entry, description) for description in STATIC_SENSORS
+        AptiRefreshIntervalSensor(coordinator, config_entry)
+        for coordinator in coordinators.values()
     )
 
-    for state_code in PAYMENT_STATE_CODES:
-        entities.append(AptiPaymentStateSensor(coordinator, config_entry, state_code, "count"))
-        entities.append(AptiPaymentStateSensor(coordinator, config_entry, state_code, "amount"))
-        entities.append(
-            AptiPaymentStateSensor(coordinator, config_entry, state_code, "state_name")
-        )
-        entities.append(
-            AptiPaymentStateSensor(coordinator, config_entry, state_code, "latest_bill_month")
-        )
-        entities.append(
-            AptiPaymentStateSensor(coordinator, config_entry, state_code, "latest_paid_date")
+    for description in STATIC_SENSORS:
+        coordinator = coordinators.get(
+            coordinator_key(description.sections, description.device_key)
         )
+        if coordinator is not None:
+            entities.append(AptiStaticSensor(coordinator, config_entry, description))
+
+    if payment_coordinator is not None:
+        for state_code in PAYMENT_STATE_CODES:
+            for metric in (
+                "count",
+                "amount",
+                "state_name",
+                "latest_bill_month",
+                "latest_paid_date",
+            ):
+                entities.append(
+                    AptiPaymentStateSensor(payment_coordinator, config_entry, state_code, metric)
+                )
 
-    for energy_key in ("electric", "water", "heat", "hotwater"):
-        entities.append(AptiEnergySensor(coordinator, config_entry, energy_key, "fee"))
-        entities.append(AptiEnergySensor(coordinator, config_entry, energy_key, "use"))
+    if energy_coordinator is not None:
+        for energy_key in ("electric", "water", "heat", "hotwater"):
+            entities.append(AptiEnergySensor(energy_coordinator, config_entry, energy_key, "fee"))
+            entities.append(AptiEnergySensor(energy_coordinator, config_entry, energy_key, "use"))
 
-    detail_items = _management_detail_rows(coordinator.data)
+    detail_items = _management_detail_rows(fee_coordinator.data)
     for item in detail_items:
-        item_no = _safe_text(item.get("itemNo"))
-        item_name = _safe_text(item.get("itemName"))
+        item_no = safe_text(item.get("itemNo"))
+        item_name = safe_text(item.get("itemName"))
         if not item_no or not item_name:
             continue
 
-        entities.append(AptiManagementDetailFeeSensor(coordinator, config_entry, item_no, item_name))
+        entities.append(
+            AptiManagementDetailFeeSensor(fee_coordinator, config_entry, item_no, item_name)
+        )
 
         for metric in ("item_no", "usage", "increase", "unit"):
             entities.append(
                 AptiManagementDetailMetaSensor(
-                    coordinator,
+                    fee_coordinator,
                     config_entry,
                     item_no,
                     item_name,
@@ -957,7 +936,7 @@ async def async_setup_entry(
             if not isinstance(sub_item, dict):
                 continue
 
-            sub_title = _safe_text(
+            sub_title = safe_text(
                 sub_item.get("title") or sub_item.get("itemName") or sub_item.get("name")
             ) or f"세부항목{sub_index}"
 
@@ -970,7 +949,7 @@ async def async_setup_entry(
 
             entities.append(
                 AptiManagementDetailSubItemSensor(
-                    coordinator,
+                    fee_coordinator,
                     config_entry,
                     item_no,
                     item_name,
@@ -980,7 +959,7 @@ async def async_setup_entry(
                 )
             )
 
-    discount = coordinator.data.get("management_fee", {}).get("discount", {})
+    discount = fee_coordinator.data.get("management_fee", {}).get("discount", {})
     if isinstance(discount, dict):
         maintenance = discount.get("maintenance", [])
         if isinstance(maintenance, list):
@@ -988,7 +967,7 @@ async def async_setup_entry(
                 if isinstance(row, dict) and row.get("title"):
                     entities.append(
                         AptiDiscountSensor(
-                            coordinator,
+                            fee_coordinator,
                             config_entry,
                             "maintenance",
                             str(row["title"]),
@@ -1001,12 +980,12 @@ async def async_setup_entry(
                 if not isinstance(row, dict) or not row.get("title"):
                     continue
                 title = str(row["title"])
-                entities.append(AptiDiscountSensor(coordinator, config_entry, "energy", title))
+                entities.append(AptiDiscountSensor(fee_coordinator, config_entry, "energy", title))
                 for child in row.get("data", []) or []:
                     if isinstance(child, dict) and child.get("title"):
                         entities.append(
                             AptiDiscountSensor(
-                                coordinator,
+                                fee_coordinator,
                                 config_entry,
                                 "energy",
                                 title,
@@ -1014,12 +993,13 @@ async def async_setup_entry(
                             )
                         )
 
-    for visit_index, row in enumerate(_parking_visit_rows(coordinator.data), start=1):
-        visit_key = _safe_text(row.get("carNoInformation")) or f"visit_{visit_index}"
+    visits = parking_coordinator.snapshot.visits if parking_coordinator is not None else ()
+    for visit_index, visit in enumerate(visits, start=1):
+        visit_key = visit.car_no or f"visit_{visit_index}"
         for field in PARKING_VISIT_FIELDS:
             entities.append(
                 AptiParkingVisitDetailSensor(
-                    coordinator,
+                    parking_coordinator,
                     config_entry,
                     visit_index,
                     visit_key,
@@ -0,0 +1,157 @@
+"""Dedicated HTTP session shared by every APTi config entry."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsCacheHitParams,
+    TraceDnsCacheMissParams,
+)
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.ssl import client_context
+
+from .const import DOMAIN
+from .limiter import DEFAULT_MAX_LIMIT
+
+DATA_SESSION = f"{DOMAIN}_session"
+
+# Keep-alive pool to the API host, sized to one account's largest fan-out.
+POOL_LIMIT_PER_HOST = DEFAULT_MAX_LIMIT
+KEEPALIVE_TIMEOUT_SECONDS = 60
+DNS_CACHE_TTL_SECONDS = 300
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+    """Connection reuse counters fed by aiohttp tracing.
+
+    Every new connection to the HTTPS API host costs a TLS handshake.
+    """
+
+    created: int = 0
+    reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return counters for diagnostics."""
+        connections = self.created + self.reused
+        return {
+            "new_connections": self.created,
+            "reused_connections": self.reused,
+            "reuse_ratio": round(self.reused / connections, 3) if connections else 0.0,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+    def trace_config(self) -> TraceConfig:
+        """Return a trace config counting into these stats."""
+
+        async def _created(
+            _session: ClientSession,
+            _context: SimpleNamespace,
+            _params: TraceConnectionCreateEndParams,
+        ) -> None:
+            self.created += 1
+
+        async def _reused(
+            _session: ClientSession,
+            _context: SimpleNamespace,
+            _params: TraceConnectionReuseconnParams,
+        ) -> None:
+            self.reused += 1
+
+        async def _dns_hit(
+            _session: ClientSession,
+            _context: SimpleNamespace,
+            _params: TraceDnsCacheHitParams,
+        ) -> None:
+            self.dns_cache_hits += 1
+
+        async def _dns_miss(
+            _session: ClientSession,
+            _context: SimpleNamespace,
+            _params: TraceDnsCacheMissParams,
+        ) -> None:
+            self.dns_cache_misses += 1
+
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(_created)
+        trace_config.on_connection_reuseconn.append(_reused)
+        trace_config.on_dns_cache_hit.append(_dns_hit)
+        trace_config.on_dns_cache_miss.append(_dns_miss)
+        return trace_config
+
+
+@dataclass(slots=True)
+class SharedSession:
+    """The dedicated session and the config entries using it."""
+
+    session: ClientSession
+    stats: ConnectionStats
+    users: set[str] = field(default_factory=set)
+
+
+def _create_session(hass: HomeAssistant) -> SharedSession:
+    stats = ConnectionStats()
+    connector = TCPConnector(
+        limit_per_host=POOL_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+        ssl=client_context(),
+    )
+    shared = SharedSession(
+        session=ClientSession(connector=connector, trace_configs=[stats.trace_config()]),
+        stats=stats,
+    )
+
+    @callback
+    def _async_close(_event: Event) -> None:
+        if hass.data.get(DATA_SESSION) is shared:
+            hass.data.pop(DATA_SESSION)
+        if not shared.session.closed:
+            hass.async_create_task(shared.session.close())
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return shared
+
+
+@callback
+def async_acquire_session(hass: HomeAssistant, entry_id: str) -> SharedSession:
+    """Return the dedicated session, creating it for its first user."""
+    shared: SharedSession | None = hass.data.get(DATA_SESSION)
+    if shared is None or shared.session.closed:
+        shared = hass.data[DATA_SESSION] = _create_session(hass)
+    shared.users.add(entry_id)
+    return shared
+
+
+async def async_release_session(hass: HomeAssistant, entry_id: str) -> None:
+    """Drop a user of the dedicated session and close it after the last one."""
+    shared: SharedSession | None = hass.data.get(DATA_SESSION)
+    if shared is None:
+        return
+    shared.users.discard(entry_id)
+    if shared.users:
+        return
+    hass.data.pop(DATA_SESSION)
+    await shared.session.close()
+
+
+def connection_stats(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return counters of the dedicated session, if one is open."""
+    shared: SharedSession | None = hass.data.get(DATA_SESSION)
+    if shared is None:
+        return None
+    return {"entries": len(shared.users), **shared.stats.as_dict()}
@@ -0,0 +1,218 @@
+"""Long-term statistics import for APTi billing history."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+import logging
+from typing import Any
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfEnergy, UnitOfVolume
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+from .helpers import safe_float, safe_int, safe_text
+from .storage import APTiBillArchive
+
+_LOGGER = logging.getLogger(__name__)
+
+CURRENCY_KRW = "KRW"
+
+ENERGY_LABELS: dict[str, str] = {
+    "electric": "전기",
+    "water": "수도",
+    "heat": "난방",
+    "hotwater": "급탕",
+}
+# Shared-area items such as "공동전기료" are not household usage.
+_SHARED_ITEM_MARKERS = ("공동", "공용")
+
+# APTi unit text -> (Home Assistant unit, recorder unit class)
+_USAGE_UNITS: dict[str, tuple[str, str]] = {
+    "kwh": (UnitOfEnergy.KILO_WATT_HOUR, "energy"),
+    "mwh": (UnitOfEnergy.MEGA_WATT_HOUR, "energy"),
+    "gj": (UnitOfEnergy.GIGA_JOULE, "energy"),
+    "gcal": (UnitOfEnergy.GIGA_CALORIE, "energy"),
+    "m3": (UnitOfVolume.CUBIC_METERS, "volume"),
+    "m³": (UnitOfVolume.CUBIC_METERS, "volume"),
+    "㎥": (UnitOfVolume.CUBIC_METERS, "volume"),
+}
+# Recorders before the unit_class column reject the key outright.
+_HAS_UNIT_CLASS = "unit_class" in StatisticMetaData.__annotations__
+
+
+def bill_month_start(bill_ym: str) -> datetime:
+    """Return local midnight on the first day of a billing month."""
+    return dt_util.start_of_local_day(date(int(bill_ym[:4]), int(bill_ym[4:6]), 1))
+
+
+def _detail_rows(management_fee: dict[str, Any]) -> list[dict[str, Any]]:
+    detail = management_fee.get("detail", [])
+    if not isinstance(detail, list):
+        return []
+    return [item for item in detail if isinstance(item, dict)]
+
+
+@dataclass(slots=True)
+class _Series:
+    name: str
+    unit: str
+    unit_class: str | None
+    values: list[tuple[str, float]]
+
+
+def _usage_unit(unit: Any) -> tuple[str, str] | None:
+    text = safe_text(unit)
+    return _USAGE_UNITS.get(text.lower().replace(" ", "")) if text else None
+
+
+def _energy_from_detail(
+    management_fee: dict[str, Any], energy_key: str
+) -> dict[str, Any] | None:
+    """Find the household fee item matching an energy category."""
+    label = ENERGY_LABELS[energy_key]
+    for item in _detail_rows(management_fee):
+        name = safe_text(item.get("itemName")) or ""
+        if label not in name or any(marker in name for marker in _SHARED_ITEM_MARKERS):
+            continue
+        if energy_key == "heat" and ENERGY_LABELS["hotwater"] in name:
+            continue
+        return {
+            "fee": item.get("price", item.get("fee")),
+            "use": item.get("usage"),
+            "unit": item.get("unit"),
+        }
+    return None
+
+
+def _energy_for_month(payloads: dict[str, Any], energy_key: str) -> dict[str, Any] | None:
+    """Return fee/use/unit of an energy category, preferring the energy endpoint."""
+    energy = payloads.get("manage_energy", {}).get("energy", {})
+    if isinstance(energy, dict) and isinstance(energy.get(energy_key), dict):
+        return energy[energy_key]
+    return _energy_from_detail(payloads.get("management_fee", {}), energy_key)
+
+
+class APTiStatisticsImporter:
+    """Import monthly fee, item and energy series as external statistics.
+
+    Every value is stamped with its billing month, and each statistic is written
+    with one bulk insert that the recorder upserts by start time.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        bill_archive: APTiBillArchive,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._bill_archive = bill_archive
+        self._prefix = f"{DOMAIN}:{slugify(entry.unique_id or entry.entry_id)}"
+        self._imported: dict[str, tuple[tuple[str, float], ...]] = {}
+
+    def ledger(self, current: dict[str, Any] | None) -> dict[str, dict[str, Any]]:
+        """Return payloads per billing month, closed months plus the open one."""
+        months = {
+            bill_ym: self._bill_archive.get(bill_ym) for bill_ym in self._bill_archive.months
+        }
+        if current:
+            bill_ym = safe_text(current.get("manage_home", {}).get("billYm"))
+            if bill_ym and len(bill_ym) == 6 and bill_ym.isdigit():
+                months[bill_ym] = {
+                    "manage_home": current.get("manage_home", {}),
+                    "management_fee": current.get("management_fee", {}),
+                    "manage_energy": current.get("manage_energy", {}),
+                }
+        return dict(sorted(months.items()))
+
+    @callback
+    def async_import(self, current: dict[str, Any] | None = None) -> None:
+        """Push changed monthly series to the recorder."""
+        if "recorder" not in self._hass.config.components:
+            return
+
+        series: dict[str, _Series] = {}
+
+        def _add(
+            suffix: str,
+            name: str,
+            bill_ym: str,
+            value: float,
+            unit: str = CURRENCY_KRW,
+            unit_class: str | None = None,
+        ) -> None:
+            entry = series.setdefault(suffix, _Series(name, unit, unit_class, []))
+            if entry.unit == unit:
+                entry.values.append((bill_ym, value))
+
+        for bill_ym, payloads in self.ledger(current).items():
+            total = safe_int(payloads.get("manage_home", {}).get("monthFee"))
+            if total is not None:
+                _add("management_fee_total", "관리비 합계", bill_ym, total)
+            for item in _detail_rows(payloads.get("management_fee", {})):
+                item_no = safe_text(item.get("itemNo"))
+                item_name = safe_text(item.get("itemName"))
+                price = safe_int(item.get("price", item.get("fee")))
+                if not item_no or not item_name or price is None:
+                    continue
+                _add(
+                    f"management_fee_item_{slugify(item_no)}",
+                    f"관리비 {item_name}",
+                    bill_ym,
+                    price,
+                )
+
+            for energy_key, label in ENERGY_LABELS.items():
+                energy = _energy_for_month(payloads, energy_key)
+                if not energy:
+                    continue
+                fee = safe_int(energy.get("fee"))
+                if fee is not None:
+                    _add(f"energy_{energy_key}_cost", f"{label} 요금", bill_ym, fee)
+                usage = safe_float(energy.get("use"))
+                unit = _usage_unit(energy.get("unit"))
+                if usage is not None and unit is not None:
+                    _add(f"energy_{energy_key}_use", f"{label} 사용량", bill_ym, usage, *unit)
+
+        for suffix, entry in series.items():
+            self._async_import_series(suffix, entry)
+
+    @callback
+    def _async_import_series(self, suffix: str, series: _Series) -> None:
+        """Write one statistic unless it is unchanged since the last import."""
+        statistic_id = f"{self._prefix}_{suffix}"
+        signature = tuple(series.values)
+        if self._imported.get(statistic_id) == signature:
+            return
+
+        running_sum: float = 0
+        rows: list[StatisticData] = []
+        for bill_ym, value in series.values:
+            running_sum += value
+            rows.append(
+                StatisticData(start=bill_month_start(bill_ym), state=value, sum=running_sum)
+            )
+
+        metadata = StatisticMetaData(
+            has_sum=True,
+            mean_type=StatisticMeanType.NONE,
+            name=f"{self._entry.title} {series.name}",
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=series.unit,
+        )
+        if _HAS_UNIT_CLASS:
+            metadata["unit_class"] = series.unit_class
+        async_add_external_statistics(self._hass, metadata, rows)
+        self._imported[statistic_id] = signature
+        _LOGGER.debug("APTi imported %s months into %s", len(rows), statistic_id)
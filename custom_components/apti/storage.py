@@ -0,0 +1,230 @@
+"""Persistent state for the APTi integration."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .api import APTiClient
+from .const import DEVICE_PARKING, DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY_SECONDS = 10
+# Snapshot keys that change on every refresh without new content.
+VOLATILE_SNAPSHOT_KEYS = frozenset({"fetched_at"})
+# Snapshots that change on most polls are written at most this often.
+SNAPSHOT_SAVE_INTERVALS: dict[str, float] = {DEVICE_PARKING: 15 * 60}
+
+
+def _stable(snapshot: Any) -> Any:
+    if not isinstance(snapshot, dict):
+        return snapshot
+    return {key: value for key, value in snapshot.items() if key not in VOLATILE_SNAPSHOT_KEYS}
+
+
+def _bill_archive_key(account_id: str) -> str:
+    return f"{DOMAIN}.bills.{slugify(account_id)}"
+
+
+class APTiStore:
+    """Keep the mbl-token and last good snapshot of each coordinator across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+        self._saved_at: dict[str, float] = {}
+
+    @property
+    def token(self) -> str | None:
+        """Return the persisted mbl-token."""
+        token = self._data.get("token")
+        return token if isinstance(token, str) and token else None
+
+    def snapshot(self, category: str) -> dict[str, Any] | None:
+        """Return the persisted data of a coordinator category."""
+        snapshot = self._data.get("snapshots", {}).get(category)
+        return snapshot if isinstance(snapshot, dict) and snapshot else None
+
+    async def async_load(self) -> None:
+        """Load persisted state from disk."""
+        data = await self._store.async_load()
+        self._data = data if isinstance(data, dict) else {}
+        if not isinstance(self._data.get("snapshots"), dict):
+            self._data["snapshots"] = {}
+
+    @callback
+    def async_save_state(
+        self, token: str | None, category: str, snapshot: dict[str, Any]
+    ) -> None:
+        """Schedule a write of the token and a coordinator's snapshot when they changed.
+
+        A changed snapshot of a category in ``SNAPSHOT_SAVE_INTERVALS`` is kept
+        in memory, and goes to disk with the next write, until its interval passed.
+        """
+        snapshots = self._data.setdefault("snapshots", {})
+        token_changed = token != self._data.get("token")
+        if not token_changed and _stable(snapshots.get(category)) == _stable(snapshot):
+            return
+        self._data["token"] = token
+        snapshots[category] = snapshot
+
+        now = time.monotonic()
+        min_interval = SNAPSHOT_SAVE_INTERVALS.get(category)
+        last_saved = self._saved_at.get(category)
+        if (
+            not token_changed
+            and min_interval is not None
+            and last_saved is not None
+            and now - last_saved < min_interval
+        ):
+            return
+        self._saved_at[category] = now
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY_SECONDS)
+
+    @property
+    def billing_cycle(self) -> dict[str, Any] | None:
+        """Return the persisted billing cycle scheduler state."""
+        state = self._data.get("billing_cycle")
+        return state if isinstance(state, dict) else None
+
+    @callback
+    def async_save_billing_cycle(self, state: dict[str, Any]) -> None:
+        """Schedule a write of the billing cycle scheduler state when it changed."""
+        if self._data.get("billing_cycle") == state:
+            return
+        self._data["billing_cycle"] = state
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY_SECONDS)
+
+    @property
+    def endpoint_breakers(self) -> dict[str, Any] | None:
+        """Return persisted circuit breakers of optional endpoints."""
+        state = self._data.get("endpoint_breakers")
+        return state if isinstance(state, dict) else None
+
+    @callback
+    def async_save_endpoint_breakers(self, state: dict[str, Any]) -> None:
+        """Schedule a write of the circuit breakers when they changed."""
+        if self._data.get("endpoint_breakers") == state:
+            return
+        self._data["endpoint_breakers"] = state
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY_SECONDS)
+
+    async def async_remove(self) -> None:
+        """Delete persisted state."""
+        self._data = {}
+        await self._store.async_remove()
+
+
+class APTiBillArchive:
+    """Per-account on-disk cache of closed billing months.
+
+    A month is closed once a later ``billYm`` has been published; its payloads
+    never change again and are served from disk forever. The open month is
+    always fetched live.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: APTiClient) -> None:
+        self._client = client
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, _bill_archive_key(client.account_id)
+        )
+        self._months: dict[str, dict[str, Any]] = {}
+        self._current_bill_ym: str | None = None
+
+    @property
+    def months(self) -> list[str]:
+        """Return archived billing months, oldest first."""
+        return sorted(self._months)
+
+    async def async_load(self) -> None:
+        """Load archived months from disk."""
+        data = await self._store.async_load()
+        months = data.get("months") if isinstance(data, dict) else None
+        self._months = months if isinstance(months, dict) else {}
+
+    @callback
+    def set_current_bill_ym(self, bill_ym: str | None) -> None:
+        """Record the latest published billing month."""
+        if bill_ym and len(bill_ym) == 6 and bill_ym.isdigit():
+            self._current_bill_ym = bill_ym
+
+    def is_closed(self, bill_ym: str) -> bool:
+        """Return True when a billing month can no longer change."""
+        return bill_ym < self.current_bill_ym()
+
+    def get(self, bill_ym: str) -> dict[str, Any]:
+        """Return archived payloads for a month."""
+        return self._months.get(bill_ym, {})
+
+    def has_month(self, bill_ym: str) -> bool:
+        """Return True when both payloads of a month are archived."""
+        month = self._months.get(bill_ym, {})
+        return "manage_home" in month and "management_fee" in month
+
+    @property
+    def published_bill_ym(self) -> str | None:
+        """Return the latest published billing month once it is known."""
+        return self._current_bill_ym
+
+    def current_bill_ym(self) -> str:
+        """Return the latest published billing month, or the calendar month."""
+        return self._current_bill_ym or dt_util.now().strftime("%Y%m")
+
+    async def async_get_manage_home(self, bill_ym: str) -> dict[str, Any]:
+        """Return management home summary for a billing month."""
+        return await self._async_get(
+            bill_ym, "manage_home", lambda: self._client.async_get_manage_home(bill_ym)
+        )
+
+    async def async_get_management_fee_history(self, bill_ym: str) -> dict[str, Any]:
+        """Return management fee detail for a billing month."""
+        return await self._async_get(
+            bill_ym,
+            "management_fee",
+            lambda: self._client.async_get_management_fee_history(bill_ym),
+        )
+
+    async def _async_get(
+        self,
+        bill_ym: str,
+        kind: str,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Serve a closed month from disk, or fetch and archive it."""
+        closed = self.is_closed(bill_ym)
+        if closed:
+            cached = self._months.get(bill_ym, {}).get(kind)
+            if isinstance(cached, dict):
+                return cached
+
+        payload = await fetch()
+        if closed and isinstance(payload, dict):
+            self._months.setdefault(bill_ym, {})[kind] = payload
+            self._store.async_delay_save(lambda: {"months": self._months}, SAVE_DELAY_SECONDS)
+        return payload
+
+    @callback
+    def async_record_open_month(self, bill_ym: str, kind: str, payload: dict[str, Any]) -> None:
+        """Keep the latest payload of a month that has no by-month endpoint.
+
+        Once the month closes the last recorded payload is kept as-is.
+        """
+        if self.is_closed(bill_ym) or not payload:
+            return
+        month = self._months.setdefault(bill_ym, {})
+        if month.get(kind) == payload:
+            return
+        month[kind] = payload
+        self._store.async_delay_save(lambda: {"months": self._months}, SAVE_DELAY_SECONDS)
+
+    @staticmethod
+    async def async_remove_account(hass: HomeAssistant, account_id: str) -> None:
+        """Delete archived months of an account."""
+        await Store(hass, STORAGE_VERSION, _bill_archive_key(account_id)).async_remove()
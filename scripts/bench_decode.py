@@ -0,0 +1,72 @@
+"""Micro-benchmark of APTiClient._decode_json against the text-then-json decode it replaced.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m scripts.bench_decode [--rows N] [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from typing import Any
+
+from custom_components.apti import api
+
+
+def _payload(rows: int) -> bytes:
+    """Return a body shaped like the management fee history."""
+    detail = [
+        {
+            "itemNo": f"{index:03d}",
+            "itemName": f"관리비 항목 {index}",
+            "fee": str(1000 * index),
+            "usage": f"{index * 1.5:.1f}",
+            "increase": "3.2",
+            "unit": "kWh",
+            "list": [
+                {"title": f"세부 {sub}", "amt": str(100 * sub), "usage": "12.5", "unit": "kWh"}
+                for sub in range(4)
+            ],
+        }
+        for index in range(rows)
+    ]
+    return json.dumps(
+        {"billYm": "202609", "monthFee": "250000", "detail": detail}, ensure_ascii=False
+    ).encode()
+
+
+def _legacy_decode(body: bytes) -> dict[str, Any] | list[Any]:
+    """Decode like response.text() followed by response.json(content_type=None)."""
+    text = body.decode("utf-8")
+    if not text:
+        return {}
+    parsed = json.loads(body.strip().decode("utf-8"))
+    if isinstance(parsed, (dict, list)):
+        return parsed
+    raise ValueError("Unexpected API response type")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200, help="detail items in the body")
+    parser.add_argument("--number", type=int, default=500, help="decodes per timing")
+    args = parser.parse_args()
+
+    body = _payload(args.rows)
+    client = api.APTiClient(None, "user", "password")
+    assert client._decode_json(body) == _legacy_decode(body)
+
+    backend = api.json_loads.__module__
+    print(f"body: {len(body):,} bytes, {args.number} decodes per timing, backend: {backend}")
+    results = {}
+    for name, decode in (("legacy", _legacy_decode), ("current", client._decode_json)):
+        best = min(timeit.repeat(lambda: decode(body), number=args.number, repeat=5))
+        results[name] = best / args.number
+        print(f"{name:>8}: {results[name] * 1e6:10.1f} µs per body")
+    print(f" speedup: {results['legacy'] / results['current']:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Benchmark of one fee refresh through the real sensor entities.
+
+Sets up the sensor platform against a management fee coordinator in a
+throwaway Home Assistant instance and times ``async_set_updated_data`` up to
+and including the state writes. Each refresh alternates between two payloads
+that are either equal in content or differ in every amount and usage. Run from the
+repository root with Home Assistant installed:
+
+    python -m scripts.bench_snapshot [--items N] [--rows N] [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+from datetime import timedelta
+import logging
+import tempfile
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er, frame
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.apti import sensor
+from custom_components.apti.api import APTiClient
+from custom_components.apti.backfill import APTiBillBackfill
+from custom_components.apti.const import DEVICE_ACCOUNT, DEVICE_MANAGEMENT_FEE, DOMAIN
+from custom_components.apti.coordinator import (
+    APTiAccountCoordinator,
+    APTiManagementFeeCoordinator,
+)
+from custom_components.apti.storage import APTiBillArchive, APTiStore
+
+DISCOUNT_GROUPS = ("energy", "welfare")
+
+
+def _data(items: int, rows: int, scale: int = 1) -> dict[str, Any]:
+    """Return fee coordinator data with ``items`` detail items of ``rows`` rows each."""
+    detail = [
+        {
+            "itemNo": f"{index:03d}",
+            "itemName": f"관리비 항목 {index}",
+            "fee": str(1000 * index * scale),
+            "usage": f"{index * 1.5 * scale:.1f}",
+            "increase": f"{3.2 * scale:.1f}",
+            "unit": "kWh",
+            "list": [
+                {
+                    "title": f"세부 {sub}",
+                    "amt": str(100 * sub * scale),
+                    "usage": f"{12.5 * scale}",
+                }
+                for sub in range(rows)
+            ],
+        }
+        for index in range(items)
+    ]
+    discount = {
+        group: [
+            {
+                "title": f"할인 {index}",
+                "amt": str(1000 * scale),
+                "data": [{"title": f"세부 {sub}", "amt": str(500 * scale)} for sub in range(2)],
+            }
+            for index in range(items // 10)
+        ]
+        for group in DISCOUNT_GROUPS
+    }
+    return {
+        "manage_home": {"billYm": "202609", "monthFee": str(250000 * scale)},
+        "management_fee": {"detail": detail, "discount": discount},
+    }
+
+
+async def _async_setup(
+    hass: HomeAssistant, data: dict[str, Any]
+) -> APTiManagementFeeCoordinator:
+    """Add the sensor platform of one config entry around a fee coordinator.
+
+    The account coordinator is set up too, as every device reads its name from it.
+    """
+    frame.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await dr.async_load(hass)
+    await er.async_load(hass)
+
+    entry = ConfigEntry(
+        version=2,
+        minor_version=1,
+        domain=DOMAIN,
+        title="bench",
+        data={CONF_USERNAME: "user", CONF_PASSWORD: "password"},
+        options={},
+        source="user",
+        unique_id="user",
+        discovery_keys={},
+        subentries_data=None,
+    )
+    # Registered without setting it up, as the test helpers' MockConfigEntry does.
+    hass.config_entries._entries[entry.entry_id] = entry
+
+    client = APTiClient(None, "user", "password")
+    store = APTiStore(hass, entry.entry_id)
+    bill_archive = APTiBillArchive(hass, client)
+    account = APTiAccountCoordinator(
+        hass, entry, client, store, bill_archive, update_interval=timedelta(days=1)
+    )
+    account.async_set_updated_data(
+        {"account": {"aptName": "벤치아파트", "dong": "101", "ho": "1001"}}
+    )
+    coordinator = APTiManagementFeeCoordinator(
+        hass, entry, client, store, bill_archive, update_interval=timedelta(hours=1)
+    )
+    coordinator.async_set_updated_data(data)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "client": client,
+        "coordinators": {DEVICE_ACCOUNT: account, DEVICE_MANAGEMENT_FEE: coordinator},
+        "bill_archive": bill_archive,
+        "backfill": APTiBillBackfill(hass, bill_archive, 0),
+    }
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name=DOMAIN,
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    platform.config_entry = entry
+    added: list[Any] = []
+    await sensor.async_setup_entry(hass, entry, added.extend)
+    await platform.async_add_entities(added)
+    return coordinator
+
+
+def _time_refreshes(
+    coordinator: APTiManagementFeeCoordinator,
+    payloads: tuple[dict[str, Any], dict[str, Any]],
+    number: int,
+) -> tuple[float, int, int]:
+    """Return the best seconds per refresh and the writes of the last one."""
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for index in range(number):
+            coordinator.async_set_updated_data(payloads[index % 2])
+        best = min(best, (time.perf_counter() - started) / number)
+    stats = coordinator.write_stats
+    return best, stats.performed, stats.suppressed
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    hass = HomeAssistant(tempfile.mkdtemp())
+    try:
+        base = _data(args.items, args.rows)
+        coordinator = await _async_setup(hass, copy.deepcopy(base))
+        print(
+            f"{len(hass.states.async_all('sensor'))} sensor states, "
+            f"{args.number} refreshes per timing"
+        )
+        scenarios = {
+            "unchanged": (copy.deepcopy(base), copy.deepcopy(base)),
+            "changed": (_data(args.items, args.rows, 2), copy.deepcopy(base)),
+        }
+        for name, payloads in scenarios.items():
+            seconds, performed, suppressed = _time_refreshes(
+                coordinator, payloads, args.number
+            )
+            print(
+                f"{name:>9}: {seconds * 1e3:9.2f} ms per refresh, "
+                f"{performed} writes, {suppressed} suppressed"
+            )
+    finally:
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100, help="detail items")
+    parser.add_argument("--rows", type=int, default=3, help="sub rows per detail item")
+    parser.add_argument("--number", type=int, default=20, help="refreshes per timing")
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Tests for APTiClient authentication handling."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+import json
+from typing import Any
+
+from multidict import CIMultiDict
+
+from custom_components.apti.api import APTiClient
+
+LOGIN_PATH = "/api/v2/login/phone"
+CHECK_TOKEN_PATH = "/api/v2/user/check-token"
+
+
+class _FakeResponse:
+    def __init__(self, status: int, payload: Any) -> None:
+        self.status = status
+        self.headers: CIMultiDict[str] = CIMultiDict()
+        self.content_length = None
+        self._body = json.dumps(payload).encode()
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class _FakeSession:
+    """Answer requests from a handler and record what was sent."""
+
+    def __init__(self, handler: Callable[[str, str, dict[str, str]], tuple[int, Any]]) -> None:
+        self._handler = handler
+        self.requests: list[tuple[str, str]] = []
+
+    @asynccontextmanager
+    async def request(self, *, method: str, url: Any, headers: dict[str, str], **_: Any):
+        self.requests.append((method, url.path))
+        await asyncio.sleep(0)
+        yield _FakeResponse(*self._handler(method, url.path, headers))
+
+    def count(self, path: str) -> int:
+        return sum(1 for _, sent in self.requests if sent == path)
+
+
+def _token_handler(valid: set[str], issue: Callable[[], str]):
+    def _handle(method: str, path: str, headers: dict[str, str]) -> tuple[int, Any]:
+        if path == LOGIN_PATH:
+            token = issue()
+            valid.add(token)
+            return 200, {"mblToken": token}
+        if headers.get("mbl-token") not in valid:
+            return 401, {"message": "expired"}
+        return 200, {"status": "ok"}
+
+    return _handle
+
+
+def test_token_check_skips_login_when_token_accepted() -> None:
+    """A token check-token accepts is kept, not replaced by a login."""
+
+    async def _run() -> None:
+        session = _FakeSession(_token_handler({"old"}, lambda: "new"))
+        client = APTiClient(session, "user", "password")
+        client.restore_token("old")
+
+        await client._async_token_check()
+
+        assert client.mbl_token == "old"
+        assert session.count(LOGIN_PATH) == 0
+        assert session.count(CHECK_TOKEN_PATH) == 1
+        await client.async_close()
+
+    asyncio.run(_run())
+
+
+def test_token_check_logs_in_when_token_rejected() -> None:
+    """A rejected token is renewed by the check, ahead of any refresh."""
+
+    async def _run() -> None:
+        session = _FakeSession(_token_handler(set(), lambda: "new"))
+        client = APTiClient(session, "user", "password")
+        client.restore_token("old")
+
+        await client._async_token_check()
+
+        assert client.mbl_token == "new"
+        assert session.count(LOGIN_PATH) == 1
+        assert session.count(CHECK_TOKEN_PATH) == 2
+        await client.async_close()
+
+    asyncio.run(_run())
+
+
+def test_concurrent_rejections_share_one_login() -> None:
+    """Requests rejected together wait on a single login POST."""
+
+    async def _run() -> None:
+        issued: list[str] = []
+
+        def _issue() -> str:
+            issued.append(f"token-{len(issued)}")
+            return issued[-1]
+
+        session = _FakeSession(_token_handler(set(), _issue))
+        client = APTiClient(session, "user", "password")
+        client.restore_token("expired")
+
+        results = await asyncio.gather(*(client.async_check_token() for _ in range(5)))
+
+        assert results == [{"status": "ok"}] * 5
+        assert session.count(LOGIN_PATH) == 1
+        assert client.mbl_token == issued[0]
+        assert client.login_stats["coalesced"] >= 4
+        await client.async_close()
+
+    asyncio.run(_run())
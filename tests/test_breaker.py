@@ -0,0 +1,80 @@
+"""Tests for the optional endpoint circuit breakers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.apti.api import APTiApiError, APTiClient, APTiRetryableError
+from custom_components.apti.breaker import FAILURE_THRESHOLD, TRANSIENT_FAILURE_THRESHOLD
+
+
+def _client() -> APTiClient:
+    return APTiClient(None, "user", "password")
+
+
+def test_errors_mark_endpoint_unsupported() -> None:
+    """Repeated API errors stop further calls."""
+
+    async def _run() -> None:
+        client = _client()
+        calls = 0
+
+        async def _fail() -> None:
+            nonlocal calls
+            calls += 1
+            raise APTiApiError("HTTP 404")
+
+        for _ in range(FAILURE_THRESHOLD + 2):
+            assert await client._optional_request("manage_energy", _fail) is None
+        assert calls == FAILURE_THRESHOLD
+        assert client.breaker_stats["endpoints"]["manage_energy"]["unsupported"]
+
+    asyncio.run(_run())
+
+
+def test_call_timeouts_trip_breaker() -> None:
+    """Timeouts reported by the caller count as transient failures."""
+
+    async def _run() -> None:
+        client = _client()
+        calls = 0
+
+        async def _hang() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(10)
+
+        for _ in range(TRANSIENT_FAILURE_THRESHOLD + 2):
+            try:
+                async with asyncio.timeout(0.01):
+                    await client._optional_request("parking_favorites", _hang)
+            except TimeoutError:
+                client.record_timeout("parking_favorites")
+            except APTiRetryableError:
+                # Tripped: failing fast without a request.
+                pass
+        assert calls == TRANSIENT_FAILURE_THRESHOLD
+        endpoint = client.breaker_stats["endpoints"]["parking_favorites"]
+        assert endpoint["tripped"]
+        assert not endpoint["unsupported"]
+
+    asyncio.run(_run())
+
+
+def test_foreign_cancellation_is_not_counted() -> None:
+    """A call cancelled for another call's sake leaves its breaker alone."""
+
+    async def _run() -> None:
+        client = _client()
+        task = asyncio.create_task(
+            client._optional_request("parking_favorites", lambda: asyncio.sleep(10))
+        )
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert client.breaker_stats["endpoints"] == {}
+
+    asyncio.run(_run())
@@ -0,0 +1,35 @@
+"""Tests for the AIMD request limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.apti.limiter import AIMDLimiter
+
+
+async def _hold(limiter: AIMDLimiter, release: asyncio.Event) -> None:
+    async with limiter.slot():
+        await release.wait()
+
+
+def test_cancelled_waiter_passes_its_wakeup_on() -> None:
+    """A waiter cancelled right after being woken does not strand the others."""
+
+    async def _run() -> None:
+        limiter = AIMDLimiter(initial=1, minimum=1, maximum=1)
+        release = asyncio.Event()
+        release.set()
+        slot = limiter.slot()
+        await slot.__aenter__()
+        woken = asyncio.create_task(_hold(limiter, asyncio.Event()))
+        blocked = asyncio.create_task(_hold(limiter, release))
+        await asyncio.sleep(0)
+
+        # Releasing wakes the first waiter; cancel it in the same tick.
+        await slot.__aexit__(None, None, None)
+        woken.cancel()
+
+        await asyncio.wait_for(blocked, timeout=1)
+        assert limiter.state["in_flight"] == 0
+
+    asyncio.run(_run())
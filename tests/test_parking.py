@@ -0,0 +1,195 @@
+"""Tests for local parking fare computations."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.apti.models import APTiSnapshot
+from custom_components.apti.parking import (
+    expected_fee,
+    remaining_minutes,
+    visit_expected_fee,
+)
+
+SEOUL = ZoneInfo("Asia/Seoul")
+
+
+@pytest.fixture(autouse=True)
+def seoul_time_zone() -> Iterator[None]:
+    """Run every test in the complexes' local time zone."""
+    original = dt_util.get_default_time_zone()
+    dt_util.set_default_time_zone(SEOUL)
+    yield
+    dt_util.set_default_time_zone(original)
+
+
+def _at(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=SEOUL)
+
+
+def _visit(
+    car_in: str, car_out: str | None = None, discount: int | None = None
+) -> dict[str, Any]:
+    return {
+        "carNoInformation": "12가3456",
+        "carInDate": car_in,
+        "carOutDate": car_out,
+        "discountTime": discount,
+    }
+
+
+def _snapshot(
+    visits: list[dict[str, Any]],
+    fetched: str,
+    *,
+    remain: int | None = None,
+    server_fee: int | None = None,
+    exceptions: dict[str, str] | None = None,
+) -> APTiSnapshot:
+    parking_visit: dict[str, Any] = {
+        "basedMinutes": 10,
+        "basedMinutesFare": 1000,
+        "exceptions": exceptions or {},
+        "carListResDtoList": visits,
+    }
+    if remain is not None:
+        parking_visit["remainTime"] = remain
+    if server_fee is not None:
+        parking_visit["expectedParkingFee"] = server_fee
+    return APTiSnapshot.from_data(
+        {"parking_visit": parking_visit, "fetched_at": _at(fetched).isoformat()}
+    )
+
+
+def test_free_allowance_covers_parked_car() -> None:
+    """Minutes parked after the fetch are free while the allowance lasts."""
+    snapshot = _snapshot(
+        [_visit("2026-10-15 10:00:00")], "2026-10-15T12:00", remain=600, server_fee=0
+    )
+    now = _at("2026-10-15T12:20")
+
+    assert remaining_minutes(snapshot, now) == 580
+    assert expected_fee(snapshot, now) == 0
+    assert visit_expected_fee(snapshot.visits[0], snapshot, now) == 0
+
+
+def test_allowance_running_out_after_fetch() -> None:
+    """Only the minutes beyond the remaining allowance are charged."""
+    snapshot = _snapshot(
+        [_visit("2026-10-15 10:00:00")], "2026-10-15T12:00", remain=10, server_fee=0
+    )
+    now = _at("2026-10-15T12:30")
+
+    assert remaining_minutes(snapshot, now) == 0
+    assert expected_fee(snapshot, now) == 2000
+    assert visit_expected_fee(snapshot.visits[0], snapshot, now) == 2000
+
+
+def test_allowance_shared_by_parked_cars() -> None:
+    """Parked cars draw on equal shares of the allowance."""
+    snapshot = _snapshot(
+        [_visit("2026-10-15 10:00:00"), _visit("2026-10-15 11:00:00")],
+        "2026-10-15T12:00",
+        remain=30,
+        server_fee=0,
+    )
+    now = _at("2026-10-15T12:20")
+
+    assert remaining_minutes(snapshot, now) == 0
+    assert [visit_expected_fee(visit, snapshot, now) for visit in snapshot.visits] == [
+        1000,
+        1000,
+    ]
+    assert expected_fee(snapshot, now) == 2000
+
+
+def test_exhausted_allowance_charges_full_visit() -> None:
+    """Without allowance left every block of the visit is charged."""
+    snapshot = _snapshot(
+        [_visit("2026-10-15 10:00:00")], "2026-10-15T12:00", remain=0, server_fee=12000
+    )
+    now = _at("2026-10-15T12:20")
+
+    assert visit_expected_fee(snapshot.visits[0], snapshot, now) == 14000
+    assert expected_fee(snapshot, now) == 14000
+
+
+def test_discount_minutes_are_not_charged() -> None:
+    """A visit's discount time comes off before blocks are counted."""
+    snapshot = _snapshot(
+        [_visit("2026-10-15 10:00:00", "2026-10-15 11:35:00", discount=30)],
+        "2026-10-15T12:00",
+        remain=0,
+    )
+
+    # 95 minutes parked, 30 discounted: 65 minutes start 7 blocks.
+    assert visit_expected_fee(snapshot.visits[0], snapshot, _at("2026-10-15T12:00")) == 7000
+
+
+def test_departed_visit_does_not_accrue() -> None:
+    """A departed visit keeps its fare while a parked one keeps growing."""
+    snapshot = _snapshot(
+        [
+            _visit("2026-10-15 10:00:00", "2026-10-15 11:00:00"),
+            _visit("2026-10-15 11:00:00"),
+        ],
+        "2026-10-15T12:00",
+        remain=0,
+        server_fee=12000,
+    )
+    departed, parked = snapshot.visits
+    fetched = _at("2026-10-15T12:00")
+    later = fetched + timedelta(minutes=30)
+
+    assert visit_expected_fee(departed, snapshot, fetched) == 6000
+    assert visit_expected_fee(departed, snapshot, later) == 6000
+    assert visit_expected_fee(parked, snapshot, fetched) == 6000
+    assert visit_expected_fee(parked, snapshot, later) == 9000
+    assert expected_fee(snapshot, later) == 15000
+
+
+def test_crossing_into_exempt_weekend() -> None:
+    """Minutes after midnight into an exempt Saturday are free."""
+    snapshot = _snapshot(
+        [_visit("2026-10-16 23:00:00")],
+        "2026-10-16T23:30",
+        remain=0,
+        server_fee=3000,
+        exceptions={"exSatUseYn": "Y"},
+    )
+    now = _at("2026-10-17T00:30")
+
+    assert visit_expected_fee(snapshot.visits[0], snapshot, now) == 6000
+    assert expected_fee(snapshot, now) == 6000
+
+
+def test_crossing_into_exempt_holiday() -> None:
+    """Minutes on a public holiday are free when holidays are exempt."""
+    pytest.importorskip("holidays")
+    # 2026-10-09 is Hangul Day.
+    snapshot = _snapshot(
+        [_visit("2026-10-08 23:30:00", "2026-10-09 01:00:00")],
+        "2026-10-09T02:00",
+        remain=0,
+        exceptions={"exHolidayUseYn": "Y"},
+    )
+
+    assert visit_expected_fee(snapshot.visits[0], snapshot, _at("2026-10-09T02:00")) == 3000
+
+
+def test_weekend_not_exempt_without_rule() -> None:
+    """Weekend minutes are charged unless the complex exempts them."""
+    snapshot = _snapshot(
+        [_visit("2026-10-16 23:00:00", "2026-10-17 00:30:00")],
+        "2026-10-17T01:00",
+        remain=0,
+    )
+
+    assert visit_expected_fee(snapshot.visits[0], snapshot, _at("2026-10-17T01:00")) == 9000